@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+✨ Showcase - Network Benchmark
+Runs fetch_github_pinned_repos against the local stub server for a set
+of latency / fault scenarios and reports time-to-projects and response
+bytes for each.
+
+Usage:
+    python bench_network.py
+    python bench_network.py --repeat 5 --scenario rest_large --json bench.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+from contextlib import redirect_stdout
+from io import StringIO
+
+from portfolio import fetch_github_pinned_repos, ranking_settings
+from stub_github import StubGitHubServer
+
+# ═══════════════════════════════════════════════════════════
+# Scenarios
+# ═══════════════════════════════════════════════════════════
+
+SCENARIOS = {
+    'pinned': {},
+    'pinned_latency': {'latency': 0.2},
+    'rest_fallback': {'empty_pinned': True, 'repo_count': 100},
+    'rest_large': {'empty_pinned': True, 'repo_count': 100, 'description_size': 20000},
+    'rest_large_identity': {'empty_pinned': True, 'repo_count': 100, 'description_size': 20000, 'gzip': False},
+    'rest_paged_stars': {'empty_pinned': True, 'repo_count': 450, 'ranking': {'sort': 'stars'}},
+    'rest_paged_score': {'empty_pinned': True, 'repo_count': 450,
+                         'ranking': {'sort': 'score', 'languages': ['python', 'go']}},
+    'server_error_recovers': {'fault': '5xx', 'fault_count': 2},
+    'server_error': {'fault': '5xx'},
+    'rate_limited': {'empty_pinned': True, 'fault': 'rate_limit'},
+    'timeout': {'fault': 'timeout'},
+    'tls_fallback': {'tls': True},
+}
+
+def run_scenario(name, options, timeout):
+    """Run one scenario against a fresh stub server and return its measurements"""
+    options = dict(options)
+    ranking = ranking_settings(options.pop('ranking', None))
+    if options.get('fault') == 'timeout':
+        options['hang_seconds'] = timeout + 1
+
+    with StubGitHubServer(**options) as server:
+        log = StringIO()
+        started = time.perf_counter()
+        with redirect_stdout(log):
+            projects = fetch_github_pinned_repos(
+                'bench-user', timeout=timeout, ranking=ranking, **server.github_config())
+        elapsed = time.perf_counter() - started
+
+    return {
+        'scenario': name,
+        'seconds': elapsed,
+        'projects': len(projects or []),
+        'requests': server.requests,
+        'bytes': server.bytes_sent,
+        'errors': sum(1 for line in log.getvalue().splitlines() if 'error' in line.lower()),
+    }
+
+def summarize(runs):
+    """Median of repeated runs for one scenario"""
+    first = runs[0]
+    return {
+        'scenario': first['scenario'],
+        'seconds': statistics.median(r['seconds'] for r in runs),
+        'projects': first['projects'],
+        'requests': first['requests'],
+        'bytes': first['bytes'],
+        'errors': first['errors'],
+        'runs': len(runs),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the GitHub fetch path against a local stub')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='scenario to run (repeatable, default: all)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per scenario (default: 3)')
+    parser.add_argument('--timeout', type=float, default=1.0, help='client timeout in seconds (default: 1)')
+    parser.add_argument('--json', help='write results as JSON')
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    results = []
+    print(f"{'scenario':<24}{'time-to-projects':>18}{'projects':>10}{'requests':>10}{'bytes':>12}{'errors':>8}")
+    for name in names:
+        runs = [run_scenario(name, SCENARIOS[name], args.timeout) for _ in range(max(1, args.repeat))]
+        result = summarize(runs)
+        results.append(result)
+        print(f"{name:<24}{result['seconds'] * 1000:>15.1f} ms{result['projects']:>10}"
+              f"{result['requests']:>10}{result['bytes']:>12,}{result['errors']:>8}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"📄 Results written to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
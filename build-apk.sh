@@ -156,6 +156,18 @@ fi
 PROJECT_COUNT=$(ls projects/*.yml 2>/dev/null | wc -l)
 echo -e "${GREEN}✓${NC} Found $PROJECT_COUNT projects"
 
+# Bundle projects and QR codes so a fresh install starts without network
+# (never from fixtures/ - that is test data)
+if python prefetch.py; then
+    echo -e "${GREEN}✓${NC} Prefetch bundle written"
+elif [ -f "bundle/projects.json" ]; then
+    echo -e "${YELLOW}!${NC} Prefetch failed - keeping existing bundle/"
+else
+    echo -e "${RED}✗ Prefetch failed and no bundle/ exists${NC}"
+    echo "Run 'python prefetch.py' once with network access, then rebuild."
+    exit 1
+fi
+
 # ═══════════════════════════════════════════════════════════
 # Step 4: Prepare buildozer
 # ═══════════════════════════════════════════════════════════
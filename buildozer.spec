@@ -5,8 +5,8 @@ package.name = showcasepro
 package.domain = dev.cod3black
 source.dir = .
 source.include_exts = py,png,jpg,kv,atlas,yml,json
-source.include_patterns = assets/*
-source.exclude_patterns = .github_cache.json,.git,__pycache__,*.pyc,build.log
+source.include_patterns = assets/*,bundle/*,bundle/qr/*
+source.exclude_patterns = tests/*,soak.py,stub_github.py,bench_network.py,prefetch.py,fixtures/*,.github_cache/*,.home_snapshot*,.quality.json,.trace*.json,export/*,.git,__pycache__,*.pyc,build.log
 version = 1.1.0
 
 # Requirements (pyjnius pinned for Python 3.11 compatibility)
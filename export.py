@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+✨ Showcase - Headless Portfolio Export
+Exports the resolved portfolio as JSON and a static HTML page
+with inline QR SVGs. Never imports Kivy.
+
+Usage:
+    python export.py                                # default config.json
+    python export.py --config a.json --config b.json
+    python export.py --username alice --username acme-org --jobs 8
+"""
+
+import sys
+import json
+import time
+import html
+import argparse
+import copy
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+from theme import COLORS
+from portfolio import load_config, load_projects, project_url
+from qrcodes import qr_svg
+
+FORMATS = ('json', 'html')
+
+# ═══════════════════════════════════════════════════════════
+# Jobs
+# ═══════════════════════════════════════════════════════════
+
+def config_job(config_path):
+    """Build an export job from a config file"""
+    config_path = Path(config_path)
+    config = load_config(config_path)
+    return {
+        'slug': config_path.stem,
+        'config': config,
+        'projects_dir': config_path.parent / 'projects',
+        'config_path': config_path,
+    }
+
+def username_job(username, base_config=None):
+    """Build an export job for a GitHub username on top of a base config"""
+    config = copy.deepcopy(base_config or load_config())
+    github = config.setdefault('github', {})
+    github.pop('accounts', None)
+    github['username'] = username
+    github['use_pinned'] = True
+    owner = config.setdefault('owner', {})
+    owner['name'] = username
+    owner['website'] = f'https://github.com/{username}'
+    return {
+        'slug': username,
+        'config': config,
+        'projects_dir': None,
+    }
+
+def assign_unique_slugs(jobs):
+    """Give every job its own output folder
+
+    Colliding config jobs (clients/*/config.json all have the stem
+    "config") are renamed after their parent directory first; anything
+    still colliding gets a numeric suffix. Compared case-insensitively
+    so case-folding filesystems can't merge two folders either.
+    """
+    counts = Counter(job['slug'].lower() for job in jobs)
+    for job in jobs:
+        config_path = job.get('config_path')
+        if counts[job['slug'].lower()] > 1 and config_path:
+            job['slug'] = f"{config_path.resolve().parent.name}-{job['slug']}"
+
+    seen = set()
+    for job in jobs:
+        slug, n = job['slug'], 2
+        while slug.lower() in seen:
+            slug = f"{job['slug']}-{n}"
+            n += 1
+        if slug != job['slug']:
+            print(f"⚠️ Duplicate export slug {job['slug']!r}, writing to {slug!r}")
+            job['slug'] = slug
+        seen.add(slug.lower())
+    return jobs
+
+def build_portfolio(job):
+    """Resolve the projects for a job and return the exported document
+
+    Raises ProjectsUnavailable instead of exporting the app's bundled
+    projects under someone else's name, unless the job allows fallback.
+    """
+    kwargs = {}
+    if job.get('projects_dir'):
+        kwargs['projects_dir'] = job['projects_dir']
+    projects = load_projects(job['config'], strict=not job.get('allow_fallback'), **kwargs)
+    return {
+        'owner': job['config'].get('owner', {}),
+        'generated_at': datetime.now().isoformat(),
+        'projects': projects,
+    }
+
+# ═══════════════════════════════════════════════════════════
+# Rendering
+# ═══════════════════════════════════════════════════════════
+
+def safe_href(url):
+    """Only allow http(s) links in the exported page"""
+    if url.startswith(('http://', 'https://')):
+        return html.escape(url, quote=True)
+    return '#'
+
+PAGE_STYLE = f"""
+body {{ margin: 0; padding: 24px; background: {COLORS['bg_primary']}; color: {COLORS['text_primary']};
+       font-family: -apple-system, 'Segoe UI', Roboto, sans-serif; }}
+header {{ text-align: center; margin-bottom: 32px; }}
+header h1 {{ margin: 0 0 8px; font-size: 28px; }}
+header p {{ margin: 4px 0; color: {COLORS['text_muted']}; }}
+.grid {{ display: flex; flex-wrap: wrap; gap: 24px; justify-content: center; }}
+.card {{ width: 300px; padding: 20px; border-radius: 20px; background: {COLORS['bg_card']};
+        border: 1.5px solid {COLORS['border_glow']}; }}
+.card h2 {{ margin: 0 0 8px; font-size: 22px; word-break: break-word; }}
+.tagline {{ color: {COLORS['text_secondary']}; font-size: 14px; min-height: 40px; }}
+.pill {{ display: inline-block; margin: 0 6px 6px 0; padding: 4px 10px; border-radius: 14px;
+        background: {COLORS['bg_secondary']}; color: {COLORS['accent_light']}; font-size: 11px; font-weight: bold; }}
+.metrics {{ color: {COLORS['text_secondary']}; font-size: 13px; margin: 8px 0; }}
+.qr {{ background: #fff; border-radius: 12px; padding: 8px; width: 160px; height: 160px; margin: 12px auto; }}
+.qr svg {{ width: 160px; height: 160px; }}
+a {{ color: {COLORS['accent_light']}; word-break: break-all; font-size: 12px; }}
+"""
+
+def render_project_card(project):
+    """Render one project as an HTML card"""
+    name = html.escape(str(project.get('name', 'Untitled')))
+    tagline = html.escape(str(project.get('tagline', '') or ''))
+    url = project_url(project)
+
+    pills = []
+    for tech in project.get('tech_stack', []):
+        tech_name = tech.get('name', tech) if isinstance(tech, dict) else tech
+        pills.append(f'<span class="pill">{html.escape(str(tech_name))}</span>')
+
+    metrics = ' · '.join(
+        f'{html.escape(str(k))}: {html.escape(str(v))}'
+        for k, v in project.get('metrics', {}).items()
+    )
+
+    parts = [
+        '<article class="card">',
+        f'<h2>{name}</h2>',
+        f'<p class="tagline">{tagline}</p>',
+        f'<div>{"".join(pills)}</div>',
+    ]
+    if metrics:
+        parts.append(f'<p class="metrics">{metrics}</p>')
+    if url:
+        parts.append(f'<div class="qr">{qr_svg(url)}</div>')
+        parts.append(f'<a href="{safe_href(url)}">{html.escape(url)}</a>')
+    parts.append('</article>')
+    return '\n'.join(parts)
+
+def render_html(portfolio):
+    """Render an exported portfolio as a standalone HTML page"""
+    owner = portfolio.get('owner', {})
+    name = html.escape(owner.get('name', 'Showcase'))
+    tagline = html.escape(owner.get('tagline', ''))
+    cards = '\n'.join(render_project_card(p) for p in portfolio['projects'])
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{name}</title>
+<style>{PAGE_STYLE}</style>
+</head>
+<body>
+<header>
+<h1>✨ {name}</h1>
+<p>{tagline}</p>
+<p>{len(portfolio['projects'])} Projects</p>
+</header>
+<main class="grid">
+{cards}
+</main>
+</body>
+</html>
+"""
+
+# ═══════════════════════════════════════════════════════════
+# Export
+# ═══════════════════════════════════════════════════════════
+
+def export_job(job, out_dir, formats=FORMATS):
+    """Export one job to out_dir/<slug>/ and return a summary"""
+    started = time.perf_counter()
+    with tracing.span('build_portfolio', slug=job['slug']):
+        portfolio = build_portfolio(job)
+
+    target = Path(out_dir) / job['slug']
+    target.mkdir(parents=True, exist_ok=True)
+    if 'json' in formats:
+        (target / 'portfolio.json').write_text(
+            json.dumps(portfolio, indent=2, ensure_ascii=False), encoding='utf-8')
+    if 'html' in formats:
+        with tracing.span('render_html', projects=len(portfolio['projects'])):
+            page = render_html(portfolio)
+        (target / 'index.html').write_text(page, encoding='utf-8')
+
+    return {
+        'slug': job['slug'],
+        'projects': len(portfolio['projects']),
+        'path': str(target),
+        'seconds': time.perf_counter() - started,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the Showcase portfolio without Kivy')
+    parser.add_argument('--config', action='append', default=[], help='config.json to export (repeatable)')
+    parser.add_argument('--username', action='append', default=[], help='GitHub username to export (repeatable)')
+    parser.add_argument('--out', default='export', help='output directory (default: export)')
+    parser.add_argument('--format', choices=FORMATS + ('all',), default='all', help='output format')
+    parser.add_argument('--jobs', type=int, default=4, help='concurrent exports (default: 4)')
+    parser.add_argument('--no-cache', action='store_true', help='ignore cached GitHub data')
+    parser.add_argument('--allow-fallback', action='store_true',
+                        help='export the bundled projects when GitHub/local projects are unavailable')
+    parser.add_argument('--trace', help='write a Chrome trace of the export to this file')
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracing.enable(args.trace)
+
+    jobs = [config_job(path) for path in args.config]
+    if args.username:
+        base_config = load_config()
+        jobs += [username_job(name, base_config) for name in args.username]
+    if not jobs:
+        jobs = [config_job(Path(__file__).parent / 'config.json')]
+    assign_unique_slugs(jobs)
+    for job in jobs:
+        job['allow_fallback'] = args.allow_fallback
+    if args.no_cache:
+        for job in jobs:
+            github = job['config'].setdefault('github', {})
+            github['cache_ttl_minutes'] = 0
+            for account in github.get('accounts') or []:
+                if isinstance(account, dict):
+                    account['cache_ttl_minutes'] = 0
+
+    formats = FORMATS if args.format == 'all' else (args.format,)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [(job, pool.submit(export_job, job, args.out, formats)) for job in jobs]
+        for job, future in futures:
+            try:
+                result = future.result()
+                print(f"✅ {result['slug']}: {result['projects']} projects → "
+                      f"{result['path']} ({result['seconds']:.2f}s)")
+            except Exception as e:
+                failed += 1
+                print(f"❌ {job['slug']}: export failed: {e}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
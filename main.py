@@ -7,36 +7,16 @@ Built with Kivy
 
 import os
 import json
-import yaml
-import urllib.request
-import urllib.error
-import ssl
-import certifi
-from pathlib import Path
+import threading
 from io import BytesIO
-from datetime import datetime, timedelta
-import qrcode
-from PIL import Image as PILImage
-
-def get_ssl_context():
-    """Get SSL context that works on Android"""
-    try:
-        ctx = ssl.create_default_context(cafile=certifi.where())
-        return ctx
-    except Exception:
-        pass
-    try:
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        return ctx
-    except Exception:
-        return None
+from datetime import datetime
+from functools import lru_cache
 
 from kivy.app import App
-from kivy.uix.screenmanager import ScreenManager, Screen, SlideTransition
+from kivy.uix.screenmanager import ScreenManager, Screen, SlideTransition, NoTransition
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.floatlayout import FloatLayout
+from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
@@ -46,342 +26,170 @@ from kivy.uix.carousel import Carousel
 from kivy.uix.popup import Popup
 from kivy.core.image import Image as CoreImage
 from kivy.graphics import Color, RoundedRectangle, Rectangle, Line
+from kivy.graphics import Fbo, ClearColor, ClearBuffers, Translate, InstructionGroup
 from kivy.core.window import Window
-from kivy.utils import get_color_from_hex
+from kivy.utils import get_color_from_hex, platform
 from kivy.clock import Clock
 from kivy.metrics import dp, sp
 from kivy.properties import StringProperty, ListProperty, ObjectProperty
 
+import tracing
+from theme import COLORS, GLOW_COLORS, hex_to_rgba
+from portfolio import (APP_DIR, load_projects, load_config, load_startup_projects,
+                       project_url, projects_digest)
+from qrcodes import bundled_qr_path, qr_png
+
 # ═══════════════════════════════════════════════════════════
-# Colors
+# QR Code Generation
 # ═══════════════════════════════════════════════════════════
 
-COLORS = {
-    'bg_primary': '#0d0d12',
-    'bg_secondary': '#16161e',
-    'bg_card': '#1a1a24',
-    'bg_card_hover': '#222230',
-    'accent': '#7c3aed',
-    'accent_light': '#a78bfa',
-    'accent_glow': '#8b5cf6',
-    'gradient_start': '#6366f1',
-    'gradient_end': '#8b5cf6',
-    'text_primary': '#f8fafc',
-    'text_secondary': '#cbd5e1',
-    'text_muted': '#64748b',
-    'success': '#22c55e',
-    'success_glow': '#4ade80',
-    'warning': '#f59e0b',
-    'border': '#2d2d3a',
-    'border_glow': '#7c3aed',
-    'gold': '#fbbf24',
-    'silver': '#94a3b8',
-}
-
-def hex_to_rgba(hex_color, alpha=1):
-    """Convert hex color to RGBA tuple"""
-    hex_color = hex_color.lstrip('#')
-    r = int(hex_color[0:2], 16) / 255
-    g = int(hex_color[2:4], 16) / 255
-    b = int(hex_color[4:6], 16) / 255
-    return (r, g, b, alpha)
+@lru_cache(maxsize=32)
+@tracing.traced('generate_qr')
+def generate_qr_texture(url, size=256):
+    """Generate QR code and return as Kivy texture
+    
+    Cached so repeated popups for the same URL share one texture instead
+    of allocating a new one per tap. QR codes pre-rendered into the bundle
+    by prefetch.py are loaded directly.
+    """
+    bundled = bundled_qr_path(url, size)
+    if bundled:
+        return CoreImage(str(bundled)).texture
+    return CoreImage(BytesIO(qr_png(url, size)), ext='png').texture
 
 # ═══════════════════════════════════════════════════════════
-# Data Loading
+# Adaptive Quality
 # ═══════════════════════════════════════════════════════════
 
-CACHE_FILE = Path(__file__).parent / '.github_cache.json'
+QUALITY_FILE = APP_DIR / '.quality.json'
+
+QUALITY_TIERS = [
+    {'name': 'high', 'glow': True, 'border_width': 1.5, 'border_segments': None, 'qr_size': 256, 'animate': True},
+    {'name': 'medium', 'glow': False, 'border_width': 1.5, 'border_segments': None, 'qr_size': 256, 'animate': True},
+    {'name': 'low', 'glow': False, 'border_width': 1, 'border_segments': 4, 'qr_size': 256, 'animate': True},
+    {'name': 'minimal', 'glow': False, 'border_width': 1, 'border_segments': 4, 'qr_size': 160, 'animate': False},
+]
 
-def fetch_url_with_retry(url, headers=None, retries=3, timeout=15):
-    """Fetch URL with SSL fallback and retries for Android compatibility"""
-    if headers is None:
-        headers = {'User-Agent': 'Showcase-App/1.0'}
+QUALITY_NAMES = [tier['name'] for tier in QUALITY_TIERS]
+
+class QualityController:
+    """Steps rendering quality down while swipes miss the frame budget
+    
+    Frame times are sampled from Clock only while the carousel is moving.
+    Each full window whose 90th percentile is over budget drops one tier;
+    the first window within budget settles the tier and persists it.
+    """
+    
+    FRAME_BUDGET = 1 / 40
+    WINDOW = 30
     
-    req = urllib.request.Request(url, headers=headers)
-    ssl_ctx = get_ssl_context()
+    def __init__(self):
+        self.tier = 0
+        self.auto = False
+        self.settled = True
+        self.on_change = None
+        self._samples = []
+        self._sampling = None
+        self._skip = False
     
-    for attempt in range(retries):
+    @property
+    def settings(self):
+        return QUALITY_TIERS[self.tier]
+    
+    def configure(self, setting='auto'):
+        """Apply config.json ui.quality: 'auto' or a fixed tier name"""
+        if setting in QUALITY_NAMES:
+            self.tier = QUALITY_NAMES.index(setting)
+            self.auto = False
+            self.settled = True
+            return
+        self.auto = True
+        saved = self._load()
+        if saved is not None:
+            self.tier = saved
+            self.settled = True
+        else:
+            self.tier = 0
+            self.settled = False
+    
+    def attach(self, carousel):
+        """Measure frame times while this carousel slides"""
+        if self.auto and not self.settled:
+            carousel.bind(_offset=self._on_offset, index=self._on_offset)
+    
+    def _on_offset(self, carousel, *args):
+        if self.settled:
+            return
+        # Read _offset from the carousel: on_index resets it to 0 inside the
+        # _offset dispatch, so observers bound later get the stale value last
+        offset = carousel._offset
+        if offset and self._sampling is None:
+            # The first tick after a swipe starts includes idle time
+            self._skip = True
+            self._sampling = Clock.schedule_interval(self._on_frame, 0)
+        elif not offset and self._sampling is not None:
+            self._sampling.cancel()
+            self._sampling = None
+    
+    def _on_frame(self, dt):
+        if self._skip:
+            self._skip = False
+            return
+        self._samples.append(dt)
+        if len(self._samples) >= self.WINDOW:
+            self._evaluate()
+    
+    def _evaluate(self):
+        samples = sorted(self._samples)
+        self._samples = []
+        p90 = samples[int(len(samples) * 0.9) - 1]
+        print(f"🎞️ Quality {self.settings['name']}: p90 frame {p90 * 1000:.1f} ms")
+        if p90 > self.FRAME_BUDGET and self.tier < len(QUALITY_TIERS) - 1:
+            self.set_tier(self.tier + 1)
+            return
+        self.settled = True
+        if self._sampling is not None:
+            self._sampling.cancel()
+            self._sampling = None
+        self._save(p90)
+    
+    def set_tier(self, tier):
+        self.tier = tier
+        print(f"🎚️ Rendering quality: {self.settings['name']}")
+        if self.on_change:
+            self.on_change(self.settings)
+    
+    def _device_key(self):
+        return f"{platform}-{Window.system_size[0]}x{Window.system_size[1]}"
+    
+    def _load(self):
         try:
-            if ssl_ctx:
-                with urllib.request.urlopen(req, timeout=timeout, context=ssl_ctx) as response:
-                    return json.loads(response.read().decode())
-            else:
-                with urllib.request.urlopen(req, timeout=timeout) as response:
-                    return json.loads(response.read().decode())
-        except ssl.SSLError as e:
-            print(f"SSL error (attempt {attempt+1}): {e}")
-            ssl_ctx = ssl.create_default_context()
-            ssl_ctx.check_hostname = False
-            ssl_ctx.verify_mode = ssl.CERT_NONE
-        except urllib.error.URLError as e:
-            print(f"URL error (attempt {attempt+1}): {e}")
+            saved = json.loads(QUALITY_FILE.read_text())
+            if saved.get('device') == self._device_key() and saved.get('tier') in QUALITY_NAMES:
+                return QUALITY_NAMES.index(saved['tier'])
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"Fetch error (attempt {attempt+1}): {e}")
-    return None
-
-def fetch_github_pinned_repos(username):
-    """Fetch pinned repositories from GitHub using REST API"""
-    try:
-        pinned_url = f"https://gh-pinned-repos-tsj7ta5xfhep.deno.dev/?username={username}"
-        print(f"🔗 Fetching from: {pinned_url}")
-        pinned = fetch_url_with_retry(pinned_url)
-        if pinned and isinstance(pinned, list) and len(pinned) > 0:
-            print(f"✅ Got {len(pinned)} pinned repos")
-            return [convert_pinned_to_project(p, i) for i, p in enumerate(pinned)]
-        
-        print("⚠️ Pinned API empty, trying GitHub API...")
-        url = f"https://api.github.com/users/{username}/repos?sort=updated&per_page=100"
-        repos = fetch_url_with_retry(url, headers={
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'Showcase-App/1.0'
-        })
-        
-        if repos and isinstance(repos, list):
-            top_repos = [r for r in repos if not r.get('fork')][:6]
-            print(f"✅ Got {len(top_repos)} repos from GitHub API")
-            return [convert_repo_to_project(r, i) for i, r in enumerate(top_repos)]
-        
-        print("❌ All GitHub fetches failed")
-        return None
-        
-    except Exception as e:
-        print(f"GitHub fetch error: {e}")
+            print(f"Quality read error: {e}")
         return None
+    
+    def _save(self, p90):
+        try:
+            QUALITY_FILE.write_text(json.dumps({
+                'device': self._device_key(),
+                'tier': self.settings['name'],
+                'frame_p90_ms': round(p90 * 1000, 2),
+                'timestamp': datetime.now().isoformat()
+            }))
+        except Exception as e:
+            print(f"Quality write error: {e}")
 
-def convert_pinned_to_project(pinned, order):
-    """Convert pinned repo format to project format"""
-    return {
-        'id': pinned.get('repo', f'project-{order}'),
-        'name': pinned.get('repo', 'Untitled'),
-        'tagline': pinned.get('description', '')[:80] if pinned.get('description') else '',
-        'description': pinned.get('description', ''),
-        'url': pinned.get('link', ''),
-        'tech_stack': [pinned.get('language', 'Code')] if pinned.get('language') else [],
-        'metrics': {
-            'stars': str(pinned.get('stars', 0)),
-            'forks': str(pinned.get('forks', 0))
-        },
-        'tags': ['github', pinned.get('language', '').lower()] if pinned.get('language') else ['github'],
-        'order': order
-    }
-
-def convert_repo_to_project(repo, order):
-    """Convert GitHub repo to project format"""
-    return {
-        'id': repo.get('name', f'project-{order}'),
-        'name': repo.get('name', 'Untitled'),
-        'tagline': (repo.get('description', '') or '')[:80],
-        'description': repo.get('description', ''),
-        'url': repo.get('html_url', ''),
-        'tech_stack': [repo.get('language', 'Code')] if repo.get('language') else [],
-        'metrics': {
-            'stars': str(repo.get('stargazers_count', 0)),
-            'forks': str(repo.get('forks_count', 0))
-        },
-        'tags': ['github', (repo.get('language', '') or '').lower()],
-        'order': order
-    }
-
-def load_cached_github(config):
-    """Load GitHub repos from cache if valid"""
-    if not CACHE_FILE.exists():
-        return None
-    try:
-        cache = json.loads(CACHE_FILE.read_text())
-        cached_time = datetime.fromisoformat(cache.get('timestamp', '2000-01-01'))
-        ttl = config.get('github', {}).get('cache_ttl_minutes', 30)
-        if datetime.now() - cached_time < timedelta(minutes=ttl):
-            return cache.get('projects', [])
-    except Exception as e:
-        print(f"Cache read error: {e}")
-    return None
 
-def save_github_cache(projects):
-    """Save projects to cache"""
-    try:
-        CACHE_FILE.write_text(json.dumps({
-            'timestamp': datetime.now().isoformat(),
-            'projects': projects
-        }, indent=2))
-    except Exception as e:
-        print(f"Cache write error: {e}")
-
-def get_bundled_projects():
-    """Return bundled projects as ultimate fallback"""
-    return [
-        {
-            'id': 'showcase-native',
-            'name': 'Showcase Native',
-            'tagline': 'Portfolio app for Android',
-            'description': 'Native Android portfolio app built with Kivy',
-            'url': 'https://github.com/wizelements/showcase-native',
-            'tech_stack': ['Python', 'Kivy', 'Android'],
-            'metrics': {'stars': '⭐', 'status': 'Live'},
-            'tags': ['mobile', 'portfolio'],
-            'order': 1
-        },
-        {
-            'id': 'github-profile',
-            'name': 'GitHub Profile',
-            'tagline': 'Check out all repositories',
-            'description': 'View full GitHub profile and all projects',
-            'url': 'https://github.com/wizelements',
-            'tech_stack': ['GitHub'],
-            'metrics': {'repos': 'All', 'type': 'Profile'},
-            'tags': ['github', 'profile'],
-            'order': 2
-        },
-        {
-            'id': 'cod3black-dev',
-            'name': 'Cod3Black Agency',
-            'tagline': 'Building Digital Excellence',
-            'description': 'Full-stack development agency portfolio',
-            'url': 'https://cod3black.dev',
-            'tech_stack': ['Next.js', 'React', 'Node.js'],
-            'metrics': {'clients': 'Active', 'rating': '5⭐'},
-            'tags': ['web', 'agency'],
-            'order': 3
-        }
-    ]
-
-def load_projects():
-    """Load projects from GitHub pinned repos with robust fallback"""
-    config = load_config()
-    github_config = config.get('github', {})
-    
-    if github_config.get('use_pinned') and github_config.get('username'):
-        cached = load_cached_github(config)
-        if cached and len(cached) > 0:
-            print(f"📦 Using {len(cached)} cached GitHub projects")
-            return cached
-        
-        print(f"🔄 Fetching GitHub pinned repos for {github_config['username']}...")
-        projects = fetch_github_pinned_repos(github_config['username'])
-        if projects and len(projects) > 0:
-            save_github_cache(projects)
-            print(f"✅ Loaded {len(projects)} projects from GitHub")
-            return projects
-        
-        print("⚠️ GitHub fetch failed - using bundled projects")
-        bundled = get_bundled_projects()
-        print(f"📱 Loaded {len(bundled)} bundled projects")
-        return bundled
-    
-    projects = []
-    projects_dir = Path(__file__).parent / 'projects'
-    
-    if projects_dir.exists():
-        for f in sorted(projects_dir.glob('*.yml')):
-            try:
-                data = yaml.safe_load(f.read_text())
-                if data:
-                    projects.append(data)
-            except Exception as e:
-                print(f"Error loading {f}: {e}")
-        
-        for f in sorted(projects_dir.glob('*.json')):
-            try:
-                data = json.loads(f.read_text())
-                if data:
-                    projects.append(data)
-            except Exception as e:
-                print(f"Error loading {f}: {e}")
-    
-    if not projects:
-        print("📱 No local projects found - using bundled projects")
-        return get_bundled_projects()
-    
-    projects.sort(key=lambda p: (p.get('order', 999), p.get('name', '')))
-    return projects
-
-def create_sample_projects(projects_dir):
-    """Create sample project files"""
-    samples = [
-        {
-            'id': 'agency-portfolio',
-            'name': 'Agency Portfolio',
-            'tagline': 'Modern creative agency site',
-            'description': 'Full-stack portfolio with headless CMS',
-            'url': 'https://cod3black.dev',
-            'tech_stack': ['Next.js', 'Sanity', 'Tailwind'],
-            'metrics': {'visitors': '12K/mo', 'score': '98'},
-            'tags': ['web', 'portfolio'],
-            'order': 1
-        },
-        {
-            'id': 'ecommerce',
-            'name': 'E-Commerce Platform',
-            'tagline': 'Full-stack shop with payments',
-            'description': 'Complete e-commerce solution with Stripe',
-            'url': 'https://shop.example.com',
-            'tech_stack': ['React', 'Node.js', 'Stripe'],
-            'metrics': {'visitors': '45K/mo', 'revenue': '$50K'},
-            'tags': ['web', 'e-commerce'],
-            'order': 2
-        },
-        {
-            'id': 'ai-dashboard',
-            'name': 'AI Analytics',
-            'tagline': 'ML insights visualization',
-            'description': 'Real-time ML model monitoring',
-            'url': 'https://ai-dash.example.com',
-            'tech_stack': ['Python', 'FastAPI', 'React'],
-            'metrics': {'models': '15', 'uptime': '99.9%'},
-            'tags': ['ai', 'dashboard'],
-            'order': 3
-        },
-        {
-            'id': 'mobile-app',
-            'name': 'Fitness App',
-            'tagline': 'Cross-platform workout tracker',
-            'description': 'Mobile app for fitness tracking',
-            'url': 'https://fitapp.example.com',
-            'tech_stack': ['React Native', 'Firebase'],
-            'metrics': {'downloads': '10K', 'rating': '4.8'},
-            'tags': ['mobile', 'health'],
-            'order': 4
-        },
-    ]
-    
-    for project in samples:
-        path = projects_dir / f"{project['id']}.yml"
-        path.write_text(yaml.dump(project, default_flow_style=False))
-
-def load_config():
-    """Load app configuration"""
-    config_path = Path(__file__).parent / 'config.json'
-    if config_path.exists():
-        return json.loads(config_path.read_text())
-    return {
-        'owner': {
-            'name': 'Cod3BlackAgency',
-            'tagline': 'Building Digital Excellence'
-        }
-    }
+QUALITY = QualityController()
 
-# ═══════════════════════════════════════════════════════════
-# QR Code Generation
-# ═══════════════════════════════════════════════════════════
-
-def generate_qr_texture(url, size=256):
-    """Generate QR code and return as Kivy texture"""
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_H,
-        box_size=10,
-        border=2,
-    )
-    qr.add_data(url)
-    qr.make(fit=True)
-    
-    img = qr.make_image(fill_color="black", back_color="white")
-    img = img.resize((size, size), PILImage.LANCZOS)
-    
-    buffer = BytesIO()
-    img.save(buffer, format='PNG')
-    buffer.seek(0)
-    
-    return CoreImage(buffer, ext='png').texture
+# Local share server, created in build() only when config enables it;
+# QR codes point at it while it is running
+SHARE = None
 
 # ═══════════════════════════════════════════════════════════
 # Custom Widgets
@@ -397,13 +205,20 @@ class GlowCard(BoxLayout):
         self.spacing = dp(14)
         self.glow_color = glow_color or COLORS['accent_glow']
         
+        # Glow lives in its own group so low quality tiers can drop it
+        self.glow_group = InstructionGroup()
+        self.glow_group.add(Color(*hex_to_rgba(self.glow_color, 0.15)))
+        self.glow = RoundedRectangle(
+            pos=(self.x - dp(4), self.y - dp(4)),
+            size=(self.width + dp(8), self.height + dp(8)),
+            radius=[dp(24)]
+        )
+        self.glow_group.add(self.glow)
+        self.canvas.before.add(self.glow_group)
+        self._glow_on = True
+        self._border_segments = None
+        
         with self.canvas.before:
-            Color(*hex_to_rgba(self.glow_color, 0.15))
-            self.glow = RoundedRectangle(
-                pos=(self.x - dp(4), self.y - dp(4)),
-                size=(self.width + dp(8), self.height + dp(8)),
-                radius=[dp(24)]
-            )
             Color(*hex_to_rgba(COLORS['bg_card']))
             self.bg = RoundedRectangle(
                 pos=self.pos,
@@ -417,13 +232,32 @@ class GlowCard(BoxLayout):
             )
         
         self.bind(pos=self._update_graphics, size=self._update_graphics)
+        self.apply_quality(QUALITY.settings)
+    
+    def apply_quality(self, settings):
+        """Add or drop the glow and simplify the border for a quality tier"""
+        if settings['glow'] != self._glow_on:
+            if settings['glow']:
+                self.canvas.before.insert(0, self.glow_group)
+            else:
+                self.canvas.before.remove(self.glow_group)
+            self._glow_on = settings['glow']
+        self.border.width = settings['border_width']
+        self._border_segments = settings['border_segments']
+        self._update_graphics()
+    
+    def _border_shape(self):
+        shape = [*self.pos, *self.size, dp(20)]
+        if self._border_segments:
+            shape.append(self._border_segments)
+        return shape
     
     def _update_graphics(self, *args):
         self.glow.pos = (self.x - dp(4), self.y - dp(4))
         self.glow.size = (self.width + dp(8), self.height + dp(8))
         self.bg.pos = self.pos
         self.bg.size = self.size
-        self.border.rounded_rectangle = [*self.pos, *self.size, dp(20)]
+        self.border.rounded_rectangle = self._border_shape()
 
 
 class RoundedCard(BoxLayout):
@@ -483,15 +317,15 @@ class ProjectCard(GlowCard):
     """Individual project display card with enhanced styling"""
     
     def __init__(self, project, index=0, on_qr=None, on_visit=None, **kwargs):
-        glow_colors = [COLORS['accent_glow'], COLORS['success'], COLORS['gold'], COLORS['accent_light']]
-        super().__init__(glow_color=glow_colors[index % len(glow_colors)], **kwargs)
+        super().__init__(glow_color=GLOW_COLORS[index % len(GLOW_COLORS)], **kwargs)
         self.project = project
         self.on_qr_callback = on_qr
         self.on_visit_callback = on_visit
         self.size_hint = (None, None)
         self.size = (dp(320), dp(420))
         
-        self._build_ui()
+        with tracing.span('build_card', index=index, project=project.get('name', '')):
+            self._build_ui()
     
     def _build_ui(self):
         # Header with status and order badge
@@ -645,10 +479,92 @@ class ProjectCard(GlowCard):
             self.on_visit_callback(self.project)
 
 
+class CachedCardSlide(RelativeLayout):
+    """Carousel slide that draws its card from a cached texture while sliding
+    
+    A RelativeLayout only moves its own Translate when the carousel shifts
+    it, so a frozen slide costs one textured quad per frame instead of the
+    card's full instruction tree. The texture is rendered once the card has
+    settled and kept until its layout or the quality tier changes, so a
+    swipe only swaps instructions.
+    """
+    
+    # Seconds to let labels and child layouts settle before rendering
+    RENDER_DELAY = 0.1
+    
+    def __init__(self, card, **kwargs):
+        super().__init__(**kwargs)
+        self.card = card
+        self.card.pos_hint = {'center_x': 0.5, 'center_y': 0.5}
+        self.add_widget(card)
+        self.frozen = False
+        self._fbo = None
+        self._dirty = True
+        self._quad = Rectangle()
+        self._quad_group = InstructionGroup()
+        self._quad_group.add(Color(1, 1, 1, 1))
+        self._quad_group.add(self._quad)
+        self._render_trigger = Clock.create_trigger(lambda dt: self.render(), self.RENDER_DELAY)
+        self.card.bind(pos=self.invalidate, size=self.invalidate)
+    
+    def invalidate(self, *args):
+        """Mark the cached texture stale and re-render once things settle"""
+        self._dirty = True
+        self._render_trigger()
+    
+    def render(self):
+        """Draw the card into the cached texture if it is stale"""
+        if not self._dirty or not self.card.width:
+            return
+        # Leave room for the glow drawn outside the card bounds
+        margin = dp(8)
+        size = (int(self.card.width + 2 * margin), int(self.card.height + 2 * margin))
+        if self._fbo is None or tuple(self._fbo.size) != size:
+            self._fbo = Fbo(size=size, with_stencilbuffer=True)
+        
+        fbo = self._fbo
+        fbo.clear()
+        with fbo:
+            # Opaque screen color so translucent layers blend exactly as live
+            ClearColor(*hex_to_rgba(COLORS['bg_primary']))
+            ClearBuffers()
+            Translate(-self.card.x + margin, -self.card.y + margin, 0)
+        if not self.frozen:
+            self.canvas.remove(self.card.canvas)
+        fbo.add(self.card.canvas)
+        fbo.draw()
+        fbo.remove(self.card.canvas)
+        if not self.frozen:
+            self.canvas.add(self.card.canvas)
+        
+        self._quad.texture = fbo.texture
+        self._quad.size = size
+        self._quad.pos = (self.card.x - margin, self.card.y - margin)
+        self._dirty = False
+    
+    def freeze(self):
+        """Swap the live card for its cached texture"""
+        if self.frozen or not self.card.width:
+            return
+        # Only a slide that never settled still has to be drawn here
+        self.render()
+        self.canvas.remove(self.card.canvas)
+        self.canvas.add(self._quad_group)
+        self.frozen = True
+    
+    def thaw(self):
+        """Put the live card back once the slide settles"""
+        if not self.frozen:
+            return
+        self.canvas.remove(self._quad_group)
+        self.canvas.add(self.card.canvas)
+        self.frozen = False
+
+
 class QRPopup(Popup):
     """Popup showing QR code for sharing"""
     
-    def __init__(self, project, **kwargs):
+    def __init__(self, project, url=None, **kwargs):
         super().__init__(**kwargs)
         self.title = ''
         self.separator_height = 0
@@ -656,7 +572,8 @@ class QRPopup(Popup):
         self.background_color = hex_to_rgba(COLORS['bg_secondary'])
         self.background = ''
         
-        url = project.get('url', project.get('urls', {}).get('live', ''))
+        share_url = SHARE.url_for(project) if SHARE is not None else None
+        url = url or share_url or project_url(project)
         
         layout = BoxLayout(orientation='vertical', padding=dp(24), spacing=dp(16))
         
@@ -669,7 +586,7 @@ class QRPopup(Popup):
         
         # QR Code
         if url:
-            qr_texture = generate_qr_texture(url, size=256)
+            qr_texture = generate_qr_texture(url, size=QUALITY.settings['qr_size'])
             qr_image = Image(texture=qr_texture, size_hint=(None, None), size=(dp(200), dp(200)))
             qr_box = BoxLayout(size_hint_y=0.6)
             qr_box.add_widget(BoxLayout())
@@ -719,12 +636,22 @@ class QRPopup(Popup):
 class HomeScreen(Screen):
     """Main carousel screen"""
     
-    def __init__(self, **kwargs):
+    def __init__(self, projects=None, config=None, **kwargs):
         super().__init__(**kwargs)
-        self.projects = load_projects()
-        self.config = load_config()
+        self.projects = projects if projects is not None else load_projects()
+        self.config = config if config is not None else load_config()
         self._build_ui()
     
+    def set_projects(self, projects):
+        """Rebuild the screen for a new project list"""
+        self.projects = projects
+        self.clear_widgets()
+        self._build_ui()
+    
+    def digest(self):
+        return projects_digest(self.projects, self.config.get('owner'))
+    
+    @tracing.traced('build_home')
     def _build_ui(self):
         layout = FloatLayout()
         
@@ -791,20 +718,29 @@ class HomeScreen(Screen):
             size_hint_y=0.75
         )
         
+        cache_cards = self.config.get('ui', {}).get('card_texture_cache', False)
         for i, project in enumerate(self.projects):
-            card_container = BoxLayout(padding=dp(20))
             card = ProjectCard(
                 project,
                 index=i,
                 on_qr=self._show_qr,
                 on_visit=self._visit_site
             )
+            if cache_cards:
+                self.carousel.add_widget(CachedCardSlide(card))
+                continue
+            card_container = BoxLayout(padding=dp(20))
             card.pos_hint = {'center_x': 0.5, 'center_y': 0.5}
             card_container.add_widget(BoxLayout())
             card_container.add_widget(card)
             card_container.add_widget(BoxLayout())
             self.carousel.add_widget(card_container)
         
+        if cache_cards:
+            # _offset is non-zero exactly while a swipe or its animation runs
+            self.carousel.bind(_offset=self._on_carousel_offset, index=self._on_carousel_offset)
+        QUALITY.attach(self.carousel)
+        
         content.add_widget(self.carousel)
         
         # Navigation hint
@@ -820,6 +756,17 @@ class HomeScreen(Screen):
         layout.add_widget(content)
         self.add_widget(layout)
     
+    def _on_carousel_offset(self, carousel, *args):
+        # The callback argument can be stale after a settle (see QualityController._on_offset)
+        if carousel._offset:
+            for slide in (carousel.previous_slide, carousel.current_slide, carousel.next_slide):
+                if isinstance(slide, CachedCardSlide):
+                    slide.freeze()
+        else:
+            for slide in carousel.slides:
+                if isinstance(slide, CachedCardSlide):
+                    slide.thaw()
+    
     def _show_qr(self, project):
         popup = QRPopup(project)
         popup.open()
@@ -829,15 +776,53 @@ class HomeScreen(Screen):
             'name': self.config.get('owner', {}).get('name', 'Portfolio'),
             'url': self.config.get('owner', {}).get('website', 'https://cod3black.dev')
         }
-        popup = QRPopup(portfolio_project)
+        share_url = SHARE.index_url() if SHARE is not None else None
+        popup = QRPopup(portfolio_project, url=share_url)
         popup.open()
     
     def _visit_site(self, project):
-        url = project.get('url', project.get('urls', {}).get('live', ''))
+        url = project_url(project)
         if url:
             import webbrowser
             webbrowser.open(url)
 
+# ═══════════════════════════════════════════════════════════
+# Instant Start Snapshot
+# ═══════════════════════════════════════════════════════════
+
+SNAPSHOT_FILE = APP_DIR / '.home_snapshot.png'
+SNAPSHOT_META_FILE = APP_DIR / '.home_snapshot.json'
+
+def load_snapshot_meta():
+    """Load metadata for the last saved home screen snapshot"""
+    if not (SNAPSHOT_FILE.exists() and SNAPSHOT_META_FILE.exists()):
+        return None
+    try:
+        return json.loads(SNAPSHOT_META_FILE.read_text())
+    except Exception as e:
+        print(f"Snapshot read error: {e}")
+        return None
+
+def snapshot_fits_window(meta):
+    """A snapshot is only usable at the window size it was rendered for"""
+    return bool(meta) and list(meta.get('window_size', [])) == list(Window.size)
+
+def save_snapshot(widget, digest):
+    """Render widget offscreen and save it as the next launch's first frame"""
+    try:
+        # export_to_png picks the format from the extension
+        tmp = SNAPSHOT_FILE.with_name('.home_snapshot.tmp.png')
+        widget.export_to_png(str(tmp))
+        os.replace(tmp, SNAPSHOT_FILE)
+        SNAPSHOT_META_FILE.write_text(json.dumps({
+            'digest': digest,
+            'window_size': list(Window.size),
+            'timestamp': datetime.now().isoformat()
+        }))
+        print("📸 Saved home screen snapshot")
+    except Exception as e:
+        print(f"Snapshot write error: {e}")
+
 # ═══════════════════════════════════════════════════════════
 # Main App
 # ═══════════════════════════════════════════════════════════
@@ -849,13 +834,127 @@ class ShowcaseApp(App):
         self.title = 'Showcase'
         Window.clearcolor = hex_to_rgba(COLORS['bg_primary'])
         
-        sm = ScreenManager()
-        sm.add_widget(HomeScreen(name='home'))
+        config = load_config()
+        trace_file = config.get('debug', {}).get('trace_file')
+        if trace_file and not tracing.enabled():
+            tracing.enable(APP_DIR / trace_file)
+        QUALITY.configure(config.get('ui', {}).get('quality', 'auto'))
+        QUALITY.on_change = self.apply_quality
+        self._setup_share_server(config.get('share_server'))
+        
+        self.root_layout = FloatLayout()
+        self.sm = None
+        self.home = None
+        self.splash = None
+        
+        # Show the last rendered home screen while the live tree is built
+        if snapshot_fits_window(load_snapshot_meta()):
+            self.splash = Image(
+                source=str(SNAPSHOT_FILE),
+                nocache=True,
+                allow_stretch=True,
+                keep_ratio=False
+            )
+            self.root_layout.add_widget(self.splash)
+        else:
+            self._build_live()
         
-        return sm
+        return self.root_layout
+    
+    def _setup_share_server(self, settings):
+        # Deferred import: the server and its page renderer cost ~120 ms
+        # at startup and most configs never enable it
+        global SHARE
+        if not (settings or {}).get('enabled'):
+            return
+        from share_server import ShareServer
+        SHARE = ShareServer()
+        SHARE.configure(settings)
     
     def on_start(self):
         print("✨ Showcase started!")
+        if self.splash is not None:
+            # Hop twice so the snapshot is drawn as the first frame before
+            # load_projects and card construction block the loop
+            Clock.schedule_once(lambda dt: Clock.schedule_once(self._build_live, 0), 0)
+    
+    @tracing.traced('build_live')
+    def _build_live(self, *args):
+        # Start from cached or bundled data; fetch fresh data off the UI thread
+        config = load_config()
+        projects, needs_refresh = load_startup_projects(config)
+        
+        self.sm = ScreenManager(transition=self._transition(QUALITY.settings))
+        self.home = HomeScreen(projects=projects, config=config, name='home')
+        self.sm.add_widget(self.home)
+        self.root_layout.add_widget(self.sm)
+        
+        if self.splash is not None:
+            self.root_layout.remove_widget(self.splash)
+            self.splash = None
+        
+        if SHARE is not None:
+            # Renders pages and binds on its own thread
+            SHARE.start(self.home.projects, config.get('owner', {}))
+        if needs_refresh:
+            threading.Thread(target=self._refresh_worker, args=(config,), daemon=True).start()
+        Clock.schedule_once(lambda dt: self.save_snapshot(), 1)
+    
+    def _refresh_worker(self, config):
+        projects = load_projects(config)
+        Clock.schedule_once(lambda dt: self._apply_refresh(projects), 0)
+    
+    def _apply_refresh(self, projects):
+        if self.home is None or projects_digest(projects, self.home.config.get('owner')) == self.home.digest():
+            return
+        print(f"🔄 Refreshed {len(projects)} projects in the background")
+        self.refresh_projects(projects)
+    
+    def refresh_projects(self, projects):
+        """Swap in a new project list and re-snapshot the home screen"""
+        if self.home is None:
+            return
+        self.home.set_projects(projects)
+        if SHARE is not None:
+            SHARE.update(self.home.projects, self.home.config.get('owner', {}))
+        Clock.schedule_once(lambda dt: self.save_snapshot(), 1)
+    
+    def _transition(self, settings):
+        return SlideTransition() if settings['animate'] else NoTransition()
+    
+    def apply_quality(self, settings):
+        """Re-style every card and the screen transition for a quality tier"""
+        if self.home is None:
+            return
+        self.sm.transition = self._transition(settings)
+        # Off-screen carousel slides are not in the widget tree, so walk each
+        for slide in self.home.carousel.slides:
+            for widget in slide.walk():
+                if isinstance(widget, GlowCard):
+                    widget.apply_quality(settings)
+            if isinstance(slide, CachedCardSlide):
+                slide.invalidate()
+    
+    def save_snapshot(self, force=False):
+        """Snapshot the home screen if what it shows has changed"""
+        if self.home is None or self.home.carousel.index != 0:
+            return
+        digest = self.home.digest()
+        meta = load_snapshot_meta()
+        if not force and snapshot_fits_window(meta) and meta.get('digest') == digest:
+            return
+        save_snapshot(self.sm, digest)
+    
+    def on_pause(self):
+        self.save_snapshot()
+        tracing.write()
+        return True
+    
+    def on_stop(self):
+        self.save_snapshot()
+        if SHARE is not None:
+            SHARE.stop()
+        tracing.write()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,822 @@
+"""
+✨ Showcase - Portfolio Data Layer
+Config, GitHub fetching, caching and project loading
+Importable without Kivy (used by main.py and export.py)
+"""
+
+import os
+import re
+import json
+import math
+import gzip
+import time
+import heapq
+import codecs
+import hashlib
+import threading
+import urllib.request
+import urllib.error
+import ssl
+from pathlib import Path
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import tracing
+
+APP_DIR = Path(__file__).parent
+CONFIG_FILE = APP_DIR / 'config.json'
+PROJECTS_DIR = APP_DIR / 'projects'
+CACHE_DIR = APP_DIR / '.github_cache'
+BUNDLE_DIR = APP_DIR / 'bundle'
+BUNDLE_FILE = BUNDLE_DIR / 'projects.json'
+
+PINNED_API_URL = 'https://gh-pinned-repos-tsj7ta5xfhep.deno.dev/'
+GITHUB_API_URL = 'https://api.github.com'
+
+def get_ssl_context():
+    """Get SSL context that works on Android"""
+    try:
+        # Imported lazily so scripts that never hit the network start fast
+        import certifi
+        ctx = ssl.create_default_context(cafile=certifi.where())
+        return ctx
+    except Exception:
+        pass
+    try:
+        return unverified_ssl_context()
+    except Exception:
+        return None
+
+def unverified_ssl_context():
+    """Last-resort context for devices whose CA store rejects the API"""
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+# ═══════════════════════════════════════════════════════════
+# GitHub Fetching
+# ═══════════════════════════════════════════════════════════
+
+def decoded_stream(response):
+    """Wrap a response so gzip bodies are decompressed while reading"""
+    if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+        return gzip.GzipFile(fileobj=response, mode='rb')
+    return response
+
+def wire_bytes(response):
+    """Bytes read off the wire so far, when the server sent Content-Length"""
+    length = response.headers.get('Content-Length')
+    if length is None:
+        return None
+    return int(length) - (response.length or 0)
+
+def iter_json_array(stream, chunk_size=16 * 1024):
+    """Yield the elements of a top-level JSON array one at a time
+
+    Reads stream in chunks so only the current element is held in memory;
+    closing the generator early stops reading.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + utf8.decode(chunk, final=eof)
+        pos = 0
+
+    def peek():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if eof:
+                return ''
+            fill()
+
+    if peek() != '[':
+        raise ValueError('Expected a JSON array')
+    pos += 1
+    if peek() == ']':
+        return
+
+    while True:
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            # Only trust the value once its separator is buffered, since
+            # a number cut at the chunk edge still decodes (e.g. "-1.5" as -1)
+            after = end
+            while after < len(buf) and buf[after] in ' \t\r\n':
+                after += 1
+            if not eof and (after == len(buf) or buf[after] not in ',]'):
+                fill()
+                continue
+            break
+        pos = end
+        yield value
+
+        separator = peek()
+        if separator == ',':
+            pos += 1
+        elif separator == ']':
+            return
+        else:
+            raise ValueError(f'Unexpected {separator!r} in JSON array')
+
+def time_left(deadline_at):
+    """Seconds until a time.monotonic() deadline, or None when there is none"""
+    if deadline_at is None:
+        return None
+    return deadline_at - time.monotonic()
+
+def fetch_url_with_retry(url, headers=None, retries=3, timeout=15, consume=None, deadline_at=None):
+    """Fetch URL with SSL fallback and retries for Android compatibility
+
+    Requests gzip and decompresses while reading. The body is decoded as
+    JSON, or passed as a byte stream to consume() when given. With
+    deadline_at (a time.monotonic() timestamp) each attempt's timeout is
+    clamped to the time left, and no attempt starts once it has passed.
+    """
+    if headers is None:
+        headers = {'User-Agent': 'Showcase-App/1.0'}
+    headers = {'Accept-Encoding': 'gzip', **headers}
+    if consume is None:
+        consume = json.load
+
+    req = urllib.request.Request(url, headers=headers)
+    ssl_ctx = get_ssl_context()
+
+    for attempt in range(retries):
+        remaining = time_left(deadline_at)
+        if remaining is not None and remaining <= 0:
+            print(f"⏱️ Deadline passed, giving up on {url}")
+            break
+        attempt_timeout = timeout if remaining is None else min(timeout, remaining)
+        try:
+            with tracing.span('fetch_attempt', url=url, attempt=attempt + 1) as span:
+                if ssl_ctx:
+                    response = urllib.request.urlopen(req, timeout=attempt_timeout, context=ssl_ctx)
+                else:
+                    response = urllib.request.urlopen(req, timeout=attempt_timeout)
+                with response:
+                    span.set(status=response.status,
+                             encoding=response.headers.get('Content-Encoding', 'identity'))
+                    with tracing.span('decode'):
+                        result = consume(decoded_stream(response))
+                    span.set(bytes=wire_bytes(response))
+                    return result
+        except ssl.SSLError as e:
+            print(f"SSL error (attempt {attempt+1}): {e}")
+            ssl_ctx = unverified_ssl_context()
+        except urllib.error.URLError as e:
+            # urlopen wraps handshake failures, certificate errors included
+            if isinstance(e.reason, ssl.SSLError):
+                print(f"SSL error (attempt {attempt+1}): {e.reason}")
+                ssl_ctx = unverified_ssl_context()
+            else:
+                print(f"URL error (attempt {attempt+1}): {e}")
+        except Exception as e:
+            print(f"Fetch error (attempt {attempt+1}): {e}")
+    return None
+
+@tracing.traced()
+def fetch_github_pinned_repos(username, account_type='user', timeout=15,
+                              pinned_api_url=PINNED_API_URL, api_url=GITHUB_API_URL, ranking=None,
+                              deadline_at=None):
+    """Fetch pinned repositories, falling back to the top-ranked REST repos
+
+    Pinned repos keep their curated order; ranking only applies to the
+    REST listing.
+    """
+    try:
+        # The pinned service only understands user profiles
+        if account_type == 'user':
+            pinned_url = f"{pinned_api_url}?username={username}"
+            print(f"🔗 Fetching from: {pinned_url}")
+            pinned = fetch_url_with_retry(pinned_url, timeout=timeout, deadline_at=deadline_at)
+            if pinned and isinstance(pinned, list) and len(pinned) > 0:
+                print(f"✅ Got {len(pinned)} pinned repos")
+                return [convert_pinned_to_project(p, i) for i, p in enumerate(pinned)]
+
+            print("⚠️ Pinned API empty, trying GitHub API...")
+        owner_path = 'orgs' if account_type == 'org' else 'users'
+        url = f"{api_url.rstrip('/')}/{owner_path}/{username}/repos?sort=updated"
+        projects = fetch_ranked_repos(url, ranking or ranking_settings(), headers={
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'Showcase-App/1.0'
+        }, timeout=timeout, deadline_at=deadline_at)
+
+        if projects is not None:
+            print(f"✅ Got {len(projects)} repos from GitHub API")
+            return projects
+
+        print("❌ All GitHub fetches failed")
+        return None
+
+    except Exception as e:
+        print(f"GitHub fetch error: {e}")
+        return None
+
+@tracing.traced()
+def convert_pinned_to_project(pinned, order):
+    """Convert pinned repo format to project format"""
+    return {
+        'id': pinned.get('repo', f'project-{order}'),
+        'name': pinned.get('repo', 'Untitled'),
+        'tagline': pinned.get('description', '')[:80] if pinned.get('description') else '',
+        'description': pinned.get('description', ''),
+        'url': pinned.get('link', ''),
+        'tech_stack': [pinned.get('language', 'Code')] if pinned.get('language') else [],
+        'metrics': {
+            'stars': str(pinned.get('stars', 0)),
+            'forks': str(pinned.get('forks', 0))
+        },
+        'tags': ['github', pinned.get('language', '').lower()] if pinned.get('language') else ['github'],
+        'order': order
+    }
+
+@tracing.traced()
+def convert_repo_to_project(repo, order):
+    """Convert GitHub repo to project format"""
+    return {
+        'id': repo.get('name', f'project-{order}'),
+        'name': repo.get('name', 'Untitled'),
+        'tagline': (repo.get('description', '') or '')[:80],
+        'description': repo.get('description', ''),
+        'url': repo.get('html_url', ''),
+        'tech_stack': [repo.get('language', 'Code')] if repo.get('language') else [],
+        'metrics': {
+            'stars': str(repo.get('stargazers_count', 0)),
+            'forks': str(repo.get('forks_count', 0))
+        },
+        'tags': ['github', (repo.get('language', '') or '').lower()],
+        'order': order
+    }
+
+# ═══════════════════════════════════════════════════════════
+# Repository Ranking
+# ═══════════════════════════════════════════════════════════
+
+RANKING_SORTS = ('updated', 'stars', 'forks', 'score')
+
+DEFAULT_RANKING = {
+    'sort': 'updated',
+    'limit': 6,
+    'languages': [],
+    'include_forks': False,
+    'max_pages': 5,
+    'weights': {'stars': 1.0, 'forks': 0.5, 'recency': 2.0},
+    'recency_half_life_days': 90,
+}
+
+def ranking_settings(*overrides):
+    """Merge ranking overrides (github.ranking, then per-account) onto the defaults"""
+    ranking = dict(DEFAULT_RANKING)
+    weights = dict(DEFAULT_RANKING['weights'])
+    for override in overrides:
+        if not override:
+            continue
+        ranking.update({k: v for k, v in override.items() if k != 'weights'})
+        weights.update(override.get('weights') or {})
+    ranking['weights'] = weights
+
+    if ranking['sort'] not in RANKING_SORTS:
+        print(f"⚠️ Unknown ranking sort {ranking['sort']!r}, using 'updated'")
+        ranking['sort'] = 'updated'
+    languages = ranking['languages'] or []
+    if isinstance(languages, str):
+        languages = [languages]
+    # Sorted so the settings compare equal across runs (see _read_cache)
+    ranking['languages'] = sorted({str(lang).lower() for lang in languages})
+    ranking['limit'] = max(1, int(ranking['limit']))
+    ranking['max_pages'] = max(1, int(ranking['max_pages']))
+    return ranking
+
+def _repo_timestamp(repo):
+    try:
+        return datetime.fromisoformat(repo['updated_at'].replace('Z', '+00:00')).timestamp()
+    except (KeyError, AttributeError, ValueError):
+        return 0.0
+
+def repo_score(repo, ranking, now):
+    """Weighted score: log-scaled stars and forks plus a decaying recency bonus"""
+    weights = ranking['weights']
+    age_days = max(0.0, now - _repo_timestamp(repo)) / 86400
+    recency = 0.5 ** (age_days / max(1, ranking['recency_half_life_days']))
+    return (weights.get('stars', 0) * math.log1p(repo.get('stargazers_count') or 0)
+            + weights.get('forks', 0) * math.log1p(repo.get('forks_count') or 0)
+            + weights.get('recency', 0) * recency)
+
+class RepoRanker:
+    """Keeps the best `limit` repos seen so far in a bounded min-heap
+
+    Repos are pushed one at a time as REST pages stream in, so memory stays
+    at `limit` entries however many repos an account has.
+    """
+
+    def __init__(self, ranking, now=None):
+        self.ranking = ranking
+        self.now = time.time() if now is None else now
+        self.seen = 0
+        self.done = False
+        self._heap = []
+        self._names = set()
+
+    def accepts(self, repo):
+        if repo.get('fork') and not self.ranking['include_forks']:
+            return False
+        languages = self.ranking['languages']
+        return not languages or (repo.get('language') or '').lower() in languages
+
+    def rank_key(self, repo):
+        sort = self.ranking['sort']
+        if sort == 'stars':
+            return (repo.get('stargazers_count') or 0, _repo_timestamp(repo))
+        if sort == 'forks':
+            return (repo.get('forks_count') or 0, _repo_timestamp(repo))
+        if sort == 'score':
+            return (repo_score(repo, self.ranking, self.now),)
+        return (_repo_timestamp(repo),)
+
+    def push(self, repo):
+        self.seen += 1
+        if not isinstance(repo, dict) or not self.accepts(repo):
+            return
+        name = repo.get('full_name') or repo.get('name')
+        if name in self._names:
+            # Repeated on a retried or shifted page
+            return
+        # -seen breaks ties in favour of the repo listed first
+        entry = (self.rank_key(repo), -self.seen)
+        if len(self._heap) < self.ranking['limit']:
+            heapq.heappush(self._heap, (entry, name, convert_repo_to_project(repo, 0)))
+        elif entry > self._heap[0][0]:
+            evicted = heapq.heapreplace(self._heap, (entry, name, convert_repo_to_project(repo, 0)))
+            self._names.discard(evicted[1])
+        else:
+            return
+        self._names.add(name)
+        # The REST listing is already newest-first, so nothing later can rank higher
+        if self.ranking['sort'] == 'updated' and len(self._heap) >= self.ranking['limit']:
+            self.done = True
+
+    def consume(self, stream):
+        """fetch_url_with_retry consumer: rank one page, return how many repos it held"""
+        count = 0
+        for repo in iter_json_array(stream):
+            count += 1
+            self.push(repo)
+            if self.done:
+                break
+        return count
+
+    def projects(self):
+        ranked = sorted(self._heap, key=lambda item: item[0], reverse=True)
+        projects = []
+        for order, (_, _, project) in enumerate(ranked):
+            project['order'] = order
+            projects.append(project)
+        return projects
+
+@tracing.traced()
+def fetch_ranked_repos(url, ranking, headers=None, timeout=15, per_page=100, deadline_at=None):
+    """Walk REST listing pages through a RepoRanker and return the top projects
+
+    Stops at the last page, at ranking['max_pages'], at deadline_at, or as
+    soon as the ranker can rule out every remaining repo. Returns None only
+    if the first page fails.
+    """
+    ranker = RepoRanker(ranking)
+    separator = '&' if '?' in url else '?'
+    for page in range(1, ranking['max_pages'] + 1):
+        if page > 1 and time_left(deadline_at) is not None and time_left(deadline_at) <= 0:
+            print(f"⏱️ Deadline passed - ranking the first {ranker.seen} repos")
+            break
+        count = fetch_url_with_retry(
+            f"{url}{separator}per_page={per_page}&page={page}",
+            headers=headers, timeout=timeout, consume=ranker.consume, deadline_at=deadline_at)
+        if count is None:
+            if page == 1:
+                return None
+            print(f"⚠️ Page {page} failed - ranking the first {ranker.seen} repos")
+            break
+        if ranker.done or count < per_page:
+            break
+    return ranker.projects()
+
+# ═══════════════════════════════════════════════════════════
+# Accounts & Cache
+# ═══════════════════════════════════════════════════════════
+
+def github_accounts(github_config):
+    """Normalize github.accounts / github.username into account dicts
+
+    Accepts plain names or {"name", "type": "user"|"org", "cache_ttl_minutes",
+    "ranking"} entries; an entry's ranking overrides github.ranking key by key.
+    Duplicate accounts are dropped, first occurrence wins.
+    """
+    entries = github_config.get('accounts')
+    if entries is None:
+        entries = github_config.get('username') or []
+    if isinstance(entries, (str, dict)):
+        entries = [entries]
+
+    default_ttl = github_config.get('cache_ttl_minutes', 30)
+    accounts = []
+    seen = set()
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'name': entry}
+        name = (entry.get('name') or '').strip()
+        account_type = entry.get('type', 'user')
+        key = (account_type, name.lower())
+        if not name or key in seen:
+            continue
+        seen.add(key)
+        accounts.append({
+            'name': name,
+            'type': account_type,
+            'cache_ttl_minutes': entry.get('cache_ttl_minutes', default_ttl),
+            'ranking': ranking_settings(github_config.get('ranking'), entry.get('ranking')),
+        })
+    return accounts
+
+def github_endpoints(github_config):
+    """Endpoint base URLs, overridable in config.json (e.g. for a local stub)"""
+    return {
+        'pinned_api_url': github_config.get('pinned_api_url', PINNED_API_URL),
+        'api_url': github_config.get('api_url', GITHUB_API_URL),
+    }
+
+def account_cache_file(account, cache_dir=CACHE_DIR):
+    """Cache file holding one account's projects"""
+    slug = re.sub(r'[^A-Za-z0-9._-]', '_', account['name'].lower())
+    return Path(cache_dir) / f"{account['type']}-{slug}.json"
+
+def load_cached_github(account, cache_dir=CACHE_DIR, allow_stale=False):
+    """Load an account's GitHub repos from cache if valid"""
+    with tracing.span('load_cached_github', account=account['name'], allow_stale=allow_stale) as span:
+        projects = _read_cache(account_cache_file(account, cache_dir), account, allow_stale)
+        span.set(hit=projects is not None)
+        return projects
+
+def _read_cache(cache_file, account, allow_stale):
+    if not cache_file.exists():
+        return None
+    try:
+        cache = json.loads(cache_file.read_text())
+        cached_time = datetime.fromisoformat(cache.get('timestamp', '2000-01-01'))
+        ttl = account.get('cache_ttl_minutes', 30)
+        # Projects ranked under different settings are only good as a stale fallback
+        same_ranking = cache.get('ranking') == account.get('ranking')
+        if allow_stale or (same_ranking and datetime.now() - cached_time < timedelta(minutes=ttl)):
+            return cache.get('projects', [])
+    except Exception as e:
+        print(f"Cache read error: {e}")
+    return None
+
+def save_github_cache(account, projects, cache_dir=CACHE_DIR):
+    """Save an account's projects to cache"""
+    cache_file = account_cache_file(account, cache_dir)
+    try:
+        with tracing.span('save_github_cache', account=account['name'], projects=len(projects)):
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+            tmp.write_text(json.dumps({
+                'timestamp': datetime.now().isoformat(),
+                'account': account['name'],
+                'ranking': account.get('ranking'),
+                'projects': projects
+            }, indent=2))
+            os.replace(tmp, cache_file)
+    except Exception as e:
+        print(f"Cache write error: {e}")
+
+def _fetch_account(account, cache_dir, timeout, endpoints, deadline_at):
+    projects = fetch_github_pinned_repos(account['name'], account['type'], timeout=timeout,
+                                         ranking=account.get('ranking'), deadline_at=deadline_at,
+                                         **endpoints)
+    if projects:
+        # Saved even if the caller stopped waiting a moment ago, so the next launch benefits
+        save_github_cache(account, projects, cache_dir)
+    return projects
+
+@tracing.traced()
+def fetch_github_accounts(accounts, cache_dir=CACHE_DIR, deadline=20, endpoints=None):
+    """Resolve projects for every account concurrently under a shared deadline
+
+    Fresh cache entries are used as-is; the rest are fetched in parallel.
+    Workers get the deadline too and stop retrying or paging once it has
+    passed, so no fetch outlives the call by more than a socket timeout.
+    Accounts that fail or miss the deadline fall back to their stale cache.
+    Returns a list of (account, projects) pairs in account order.
+    """
+    results = {}
+    pending = []
+    for account in accounts:
+        cached = load_cached_github(account, cache_dir)
+        if cached:
+            print(f"📦 Using {len(cached)} cached projects for {account['name']}")
+            results[account['name']] = cached
+        else:
+            pending.append(account)
+
+    if pending:
+        print(f"🔄 Fetching GitHub repos for {', '.join(a['name'] for a in pending)}...")
+        deadline_at = time.monotonic() + deadline
+        pool = ThreadPoolExecutor(max_workers=len(pending))
+        futures = {
+            pool.submit(_fetch_account, account, cache_dir, min(15, deadline), endpoints or {},
+                        deadline_at): account
+            for account in pending
+        }
+        done, _ = wait(futures, timeout=deadline)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        for future, account in futures.items():
+            projects = future.result() if future in done else None
+            if not projects:
+                print(f"⚠️ No fresh data for {account['name']}")
+                projects = load_cached_github(account, cache_dir, allow_stale=True)
+            if projects:
+                results[account['name']] = projects
+
+    return [(account, results[account['name']]) for account in accounts if account['name'] in results]
+
+def _dedupe_key(project):
+    url = project_url(project).strip().lower().rstrip('/')
+    return url or f"id:{project.get('id', '')}".lower()
+
+@tracing.traced()
+def merge_projects(account_projects):
+    """Merge per-account project lists into one ordered, deduplicated list"""
+    merged = []
+    seen_keys = set()
+    seen_ids = set()
+    for account, projects in account_projects:
+        for project in projects:
+            key = _dedupe_key(project)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            project = dict(project)
+            if project.get('id') in seen_ids:
+                project['id'] = f"{account['name']}/{project.get('id')}"
+            seen_ids.add(project.get('id'))
+            project['order'] = len(merged)
+            merged.append(project)
+    return merged
+
+# ═══════════════════════════════════════════════════════════
+# Project Loading
+# ═══════════════════════════════════════════════════════════
+
+class ProjectsUnavailable(Exception):
+    """Raised by load_projects(strict=True) instead of using bundled projects"""
+
+def load_bundle(bundle_file=BUNDLE_FILE):
+    """Load the project snapshot written into the app bundle by prefetch.py"""
+    bundle_file = Path(bundle_file)
+    if not bundle_file.exists():
+        return None
+    try:
+        return json.loads(bundle_file.read_text())
+    except Exception as e:
+        print(f"Bundle read error: {e}")
+        return None
+
+def get_bundled_projects():
+    """Return bundled projects as ultimate fallback"""
+    bundle = load_bundle()
+    if bundle and bundle.get('projects'):
+        return bundle['projects']
+    return [
+        {
+            'id': 'showcase-native',
+            'name': 'Showcase Native',
+            'tagline': 'Portfolio app for Android',
+            'description': 'Native Android portfolio app built with Kivy',
+            'url': 'https://github.com/wizelements/showcase-native',
+            'tech_stack': ['Python', 'Kivy', 'Android'],
+            'metrics': {'stars': '⭐', 'status': 'Live'},
+            'tags': ['mobile', 'portfolio'],
+            'order': 1
+        },
+        {
+            'id': 'github-profile',
+            'name': 'GitHub Profile',
+            'tagline': 'Check out all repositories',
+            'description': 'View full GitHub profile and all projects',
+            'url': 'https://github.com/wizelements',
+            'tech_stack': ['GitHub'],
+            'metrics': {'repos': 'All', 'type': 'Profile'},
+            'tags': ['github', 'profile'],
+            'order': 2
+        },
+        {
+            'id': 'cod3black-dev',
+            'name': 'Cod3Black Agency',
+            'tagline': 'Building Digital Excellence',
+            'description': 'Full-stack development agency portfolio',
+            'url': 'https://cod3black.dev',
+            'tech_stack': ['Next.js', 'React', 'Node.js'],
+            'metrics': {'clients': 'Active', 'rating': '5⭐'},
+            'tags': ['web', 'agency'],
+            'order': 3
+        }
+    ]
+
+@tracing.traced()
+def load_projects(config=None, cache_dir=CACHE_DIR, projects_dir=PROJECTS_DIR, strict=False):
+    """Load projects from GitHub pinned repos with robust fallback
+
+    With strict, raise ProjectsUnavailable rather than fall back to the
+    bundled projects, which belong to the app's own owner, or silently drop
+    an account that returned nothing.
+    """
+    if config is None:
+        config = load_config()
+    github_config = config.get('github', {})
+    accounts = github_accounts(github_config)
+
+    if github_config.get('use_pinned') and accounts:
+        account_projects = fetch_github_accounts(
+            accounts, cache_dir,
+            deadline=github_config.get('fetch_deadline_seconds', 20),
+            endpoints=github_endpoints(github_config))
+        if strict and len(account_projects) < len(accounts):
+            resolved = {account['name'] for account, _ in account_projects}
+            missing = [a['name'] for a in accounts if a['name'] not in resolved]
+            raise ProjectsUnavailable(f"no projects for GitHub account(s) {', '.join(missing)}")
+        projects = merge_projects(account_projects)
+        if projects:
+            print(f"✅ Loaded {len(projects)} projects from {len(account_projects)} GitHub account(s)")
+            return projects
+
+        if strict:
+            raise ProjectsUnavailable('GitHub fetch failed')
+        print("⚠️ GitHub fetch failed - using bundled projects")
+        bundled = get_bundled_projects()
+        print(f"📱 Loaded {len(bundled)} bundled projects")
+        return bundled
+
+    projects = []
+    projects_dir = Path(projects_dir)
+
+    if projects_dir.exists():
+        yml_files = sorted(projects_dir.glob('*.yml'))
+        if yml_files:
+            # PyYAML is only needed for local project files
+            import yaml
+        for f in yml_files:
+            try:
+                data = yaml.safe_load(f.read_text())
+                if data:
+                    projects.append(data)
+            except Exception as e:
+                print(f"Error loading {f}: {e}")
+
+        for f in sorted(projects_dir.glob('*.json')):
+            try:
+                data = json.loads(f.read_text())
+                if data:
+                    projects.append(data)
+            except Exception as e:
+                print(f"Error loading {f}: {e}")
+
+    if not projects:
+        if strict:
+            raise ProjectsUnavailable(f'no local projects in {projects_dir}')
+        print("📱 No local projects found - using bundled projects")
+        return get_bundled_projects()
+
+    projects.sort(key=lambda p: (p.get('order', 999), p.get('name', '')))
+    return projects
+
+def load_startup_projects(config=None, cache_dir=CACHE_DIR):
+    """Projects to show immediately at launch, without touching the network
+
+    Returns (projects, needs_refresh). When some account has no fresh cache,
+    stale caches (or the build-time bundle if an account was never cached)
+    are returned with needs_refresh=True so the caller can run
+    load_projects() in the background. Returns (None, False) when nothing
+    local is available and the caller should load synchronously.
+    """
+    if config is None:
+        config = load_config()
+    github_config = config.get('github', {})
+    accounts = github_accounts(github_config)
+    if not (github_config.get('use_pinned') and accounts):
+        return load_projects(config, cache_dir), False
+
+    with tracing.span('load_startup_projects', accounts=len(accounts)) as span:
+        fresh = [load_cached_github(account, cache_dir) for account in accounts]
+        if all(fresh):
+            span.set(source='cache')
+            return merge_projects(list(zip(accounts, fresh))), False
+
+        stale = [load_cached_github(account, cache_dir, allow_stale=True) for account in accounts]
+        if all(stale):
+            span.set(source='stale_cache')
+            return merge_projects(list(zip(accounts, stale))), True
+
+        bundle = load_bundle()
+        if bundle and bundle.get('projects'):
+            span.set(source='bundle')
+            print(f"📦 Starting from {len(bundle['projects'])} bundled projects")
+            return bundle['projects'], True
+
+        span.set(source=None)
+        return None, False
+
+def create_sample_projects(projects_dir):
+    """Create sample project files"""
+    import yaml
+    samples = [
+        {
+            'id': 'agency-portfolio',
+            'name': 'Agency Portfolio',
+            'tagline': 'Modern creative agency site',
+            'description': 'Full-stack portfolio with headless CMS',
+            'url': 'https://cod3black.dev',
+            'tech_stack': ['Next.js', 'Sanity', 'Tailwind'],
+            'metrics': {'visitors': '12K/mo', 'score': '98'},
+            'tags': ['web', 'portfolio'],
+            'order': 1
+        },
+        {
+            'id': 'ecommerce',
+            'name': 'E-Commerce Platform',
+            'tagline': 'Full-stack shop with payments',
+            'description': 'Complete e-commerce solution with Stripe',
+            'url': 'https://shop.example.com',
+            'tech_stack': ['React', 'Node.js', 'Stripe'],
+            'metrics': {'visitors': '45K/mo', 'revenue': '$50K'},
+            'tags': ['web', 'e-commerce'],
+            'order': 2
+        },
+        {
+            'id': 'ai-dashboard',
+            'name': 'AI Analytics',
+            'tagline': 'ML insights visualization',
+            'description': 'Real-time ML model monitoring',
+            'url': 'https://ai-dash.example.com',
+            'tech_stack': ['Python', 'FastAPI', 'React'],
+            'metrics': {'models': '15', 'uptime': '99.9%'},
+            'tags': ['ai', 'dashboard'],
+            'order': 3
+        },
+        {
+            'id': 'mobile-app',
+            'name': 'Fitness App',
+            'tagline': 'Cross-platform workout tracker',
+            'description': 'Mobile app for fitness tracking',
+            'url': 'https://fitapp.example.com',
+            'tech_stack': ['React Native', 'Firebase'],
+            'metrics': {'downloads': '10K', 'rating': '4.8'},
+            'tags': ['mobile', 'health'],
+            'order': 4
+        },
+    ]
+
+    for project in samples:
+        path = Path(projects_dir) / f"{project['id']}.yml"
+        path.write_text(yaml.dump(project, default_flow_style=False))
+
+def load_config(config_path=CONFIG_FILE):
+    """Load app configuration"""
+    config_path = Path(config_path)
+    with tracing.span('load_config', path=str(config_path)):
+        if config_path.exists():
+            return json.loads(config_path.read_text())
+    return {
+        'owner': {
+            'name': 'Cod3BlackAgency',
+            'tagline': 'Building Digital Excellence'
+        }
+    }
+
+def project_url(project):
+    """Return the shareable URL for a project"""
+    return project.get('url', project.get('urls', {}).get('live', ''))
+
+def projects_digest(projects, owner=None):
+    """Stable hash of what the home screen displays"""
+    payload = json.dumps({'owner': owner or {}, 'projects': projects}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
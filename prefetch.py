@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+✨ Showcase - Build-time Prefetch
+Runs the real GitHub fetch pipeline for the configured accounts and
+writes a project snapshot plus pre-rendered QR PNGs into bundle/, which
+buildozer packages with the app. First launch starts from the bundle
+and refreshes in the background.
+
+Usage:
+    python prefetch.py                              # before buildozer android debug
+    python prefetch.py --fixtures fixtures/github   # offline, against recorded JSON
+"""
+
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+from contextlib import nullcontext
+from datetime import datetime
+
+from portfolio import (
+    BUNDLE_DIR, ProjectsUnavailable, load_config, load_projects, github_accounts,
+    github_endpoints, fetch_github_accounts, merge_projects, project_url, projects_digest,
+)
+from qrcodes import qr_png, qr_filename
+
+# Every qr_size used by QUALITY_TIERS in main.py
+QR_SIZES = (256, 160)
+
+def resolve_projects(config, cache_dir):
+    """Fetch projects the same way the app does, minus the bundled fallback"""
+    github_config = config.get('github', {})
+    accounts = github_accounts(github_config)
+    if not (github_config.get('use_pinned') and accounts):
+        # Strict, so the bundle never snapshots placeholder projects
+        return load_projects(config, cache_dir, strict=True)
+
+    account_projects = fetch_github_accounts(
+        accounts, cache_dir,
+        deadline=github_config.get('fetch_deadline_seconds', 20),
+        endpoints=github_endpoints(github_config))
+    missing = [a['name'] for a in accounts if a['name'] not in {acc['name'] for acc, _ in account_projects}]
+    if missing:
+        print(f"⚠️ No projects for {', '.join(missing)}")
+    return merge_projects(account_projects)
+
+def write_bundle(config, projects, out_dir):
+    """Write projects.json and qr/*.png into out_dir, replacing older QR files"""
+    out_dir = Path(out_dir)
+    qr_dir = out_dir / 'qr'
+    if qr_dir.exists():
+        shutil.rmtree(qr_dir)
+    qr_dir.mkdir(parents=True)
+
+    owner = config.get('owner', {})
+    bundle = {
+        'generated_at': datetime.now().isoformat(),
+        'digest': projects_digest(projects, owner),
+        'owner': owner,
+        'projects': projects,
+    }
+    bundle_file = out_dir / 'projects.json'
+    tmp_file = bundle_file.with_suffix('.tmp')
+    tmp_file.write_text(json.dumps(bundle, indent=2))
+    tmp_file.replace(bundle_file)
+
+    urls = {project_url(p) for p in projects}
+    urls.discard('')
+    for url in sorted(urls):
+        for size in QR_SIZES:
+            (qr_dir / qr_filename(url, size)).write_bytes(qr_png(url, size))
+    return bundle_file, len(urls) * len(QR_SIZES)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Prefetch projects and QR codes into the app bundle')
+    parser.add_argument('--config', default=None, help='config file (default: config.json)')
+    parser.add_argument('--out', default=str(BUNDLE_DIR), help=f'bundle directory (default: {BUNDLE_DIR})')
+    parser.add_argument('--fixtures', help='serve GitHub responses from this fixture directory instead of the network')
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config) if args.config else load_config()
+    stub = nullcontext()
+    if args.fixtures:
+        from stub_github import StubGitHubServer
+        stub = StubGitHubServer(fixtures_dir=args.fixtures)
+
+    with stub as server:
+        if server:
+            config = dict(config)
+            config['github'] = {**config.get('github', {}), **server.github_config()}
+            print(f"🧪 Using fixtures from {args.fixtures}")
+        # A throwaway cache so the snapshot always reflects a real fetch
+        with tempfile.TemporaryDirectory() as cache_dir:
+            try:
+                projects = resolve_projects(config, cache_dir)
+            except ProjectsUnavailable as e:
+                print(f"⚠️ {e}")
+                projects = None
+
+    if not projects:
+        print("❌ No projects fetched - bundle not written")
+        return 1
+
+    bundle_file, qr_count = write_bundle(config, projects, args.out)
+    print(f"📦 Wrote {len(projects)} projects to {bundle_file}")
+    print(f"🔳 Rendered {qr_count} QR codes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+✨ Showcase - QR Rendering
+PNG and SVG QR codes without Kivy, plus lookup of QR buffers
+pre-rendered into the app bundle by prefetch.py
+"""
+
+import hashlib
+from io import BytesIO
+
+import qrcode
+
+from portfolio import BUNDLE_DIR
+
+BUNDLE_QR_DIR = BUNDLE_DIR / 'qr'
+
+def make_qr(url):
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_H,
+        box_size=10,
+        border=2,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+    return qr
+
+def qr_png(url, size=256):
+    """Render a QR code as PNG bytes of size x size pixels"""
+    from PIL import Image as PILImage
+
+    img = make_qr(url).make_image(fill_color="black", back_color="white")
+    img = img.resize((size, size), PILImage.LANCZOS)
+
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def qr_svg(url):
+    """Render a QR code as an inline SVG string"""
+    # The SVG factory needs neither PIL nor Kivy
+    from qrcode.image.svg import SvgPathImage
+
+    buffer = BytesIO()
+    make_qr(url).make_image(image_factory=SvgPathImage).save(buffer)
+    svg = buffer.getvalue().decode('utf-8')
+    if svg.startswith('<?xml'):
+        svg = svg[svg.index('?>') + 2:].lstrip()
+    return svg
+
+def qr_filename(url, size):
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+    return f'{digest}-{size}.png'
+
+def bundled_qr_path(url, size, bundle_qr_dir=BUNDLE_QR_DIR):
+    """Path of a pre-rendered QR PNG for url, or None if not bundled"""
+    path = bundle_qr_dir / qr_filename(url, size)
+    return path if path.exists() else None
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+✨ Showcase - Local Share Server
+Optional asyncio HTTP server that serves a pre-rendered page per project
+(plus the whole portfolio) from the already-loaded data, so QR scans at
+events hit the phone over the venue Wi-Fi instead of a slow external site.
+Pages are rendered and gzipped once whenever the projects change and are
+revalidated with ETags. The server runs its own event loop in a daemon
+thread, so the Kivy loop never waits on it.
+
+Enable in config.json:
+    "share_server": {"enabled": true, "port": 8080}
+
+Usage:
+    python share_server.py                          # serve until Ctrl+C
+    python share_server.py --load-test --concurrency 200 --requests 20000
+"""
+
+import sys
+import json
+import gzip
+import html
+import time
+import socket
+import asyncio
+import hashlib
+import argparse
+import threading
+import statistics
+from urllib.parse import quote
+
+import tracing
+from export import PAGE_STYLE, render_html, render_project_card
+from portfolio import get_bundled_projects, load_config, load_projects
+
+DEFAULT_PORT = 8080
+BACKLOG = 1024
+KEEPALIVE_TIMEOUT = 15
+MAX_HEADER_BYTES = 16 * 1024
+
+# ═══════════════════════════════════════════════════════════
+# Pages
+# ═══════════════════════════════════════════════════════════
+
+class Page:
+    """A response body compressed once, with its precomputed headers"""
+
+    __slots__ = ('etag', 'bodies', 'headers')
+
+    def __init__(self, body, content_type='text/html; charset=utf-8'):
+        raw = body.encode('utf-8')
+        self.etag = '"' + hashlib.sha1(raw).hexdigest()[:20] + '"'
+        # mtime=0 keeps the gzip bytes identical across renders
+        self.bodies = {False: raw, True: gzip.compress(raw, compresslevel=9, mtime=0)}
+        self.headers = {}
+        for gzipped, data in self.bodies.items():
+            fields = [
+                f'Content-Type: {content_type}',
+                f'Content-Length: {len(data)}',
+                f'ETag: {self.etag}',
+                'Cache-Control: public, max-age=60',
+                'Vary: Accept-Encoding',
+            ]
+            if gzipped:
+                fields.append('Content-Encoding: gzip')
+            self.headers[gzipped] = ('\r\n'.join(fields) + '\r\n').encode('latin-1')
+
+def share_path(project):
+    """URL path of a project's page, or None for projects without an id"""
+    key = project.get('id') or project.get('name')
+    if not key:
+        return None
+    return '/p/' + quote(str(key), safe='')
+
+def render_project_page(project, owner):
+    """Render a single project as a standalone HTML page"""
+    name = html.escape(str(project.get('name', 'Untitled')))
+    owner_name = html.escape(owner.get('name', 'Showcase'))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{name} · {owner_name}</title>
+<style>{PAGE_STYLE}</style>
+</head>
+<body>
+<header>
+<h1>✨ {owner_name}</h1>
+<p><a href="/">All projects</a></p>
+</header>
+<main class="grid">
+{render_project_card(project)}
+</main>
+</body>
+</html>
+"""
+
+@tracing.traced()
+def render_pages(projects, owner):
+    """Render every page the server can answer, keyed by path"""
+    portfolio = {'owner': owner, 'projects': projects}
+    index = Page(render_html(portfolio))
+    pages = {
+        '/': index,
+        '/index.html': index,
+        '/portfolio.json': Page(json.dumps(portfolio, ensure_ascii=False),
+                                'application/json; charset=utf-8'),
+    }
+    for project in projects:
+        path = share_path(project)
+        if path:
+            pages[path] = Page(render_project_page(project, owner))
+    return pages
+
+def lan_ip():
+    """Address other devices on the local network can reach us at, or None"""
+    # Connecting a UDP socket picks the outgoing interface without sending anything
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.connect(('10.255.255.255', 1))
+        address = sock.getsockname()[0]
+    except OSError:
+        return None
+    finally:
+        sock.close()
+    return None if is_loopback(address) else address
+
+def is_loopback(host):
+    return host == 'localhost' or host.startswith('127.') or host == '::1'
+
+
+# ═══════════════════════════════════════════════════════════
+# Server
+# ═══════════════════════════════════════════════════════════
+
+STATUS_LINES = {
+    200: b'HTTP/1.1 200 OK\r\n',
+    304: b'HTTP/1.1 304 Not Modified\r\n',
+    400: b'HTTP/1.1 400 Bad Request\r\n',
+    404: b'HTTP/1.1 404 Not Found\r\n',
+    405: b'HTTP/1.1 405 Method Not Allowed\r\n',
+}
+
+class ShareServer:
+    """Serves pre-rendered project pages from a background asyncio loop"""
+
+    def __init__(self):
+        self.enabled = False
+        self.host = '0.0.0.0'
+        self.port = DEFAULT_PORT
+        self.public_host = None
+        self.pages = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+        # Latest (projects, owner) and its version, so updates that land
+        # before the loop is up are rendered once it is
+        self._lock = threading.Lock()
+        self._content = ((), {})
+        self._version = 0
+        self._rendered_version = -1
+
+    def configure(self, settings):
+        """Apply the share_server section of config.json"""
+        settings = settings or {}
+        self.enabled = bool(settings.get('enabled', False))
+        self.host = settings.get('host', '0.0.0.0')
+        self.port = int(settings.get('port', DEFAULT_PORT))
+        self.public_host = settings.get('public_host')
+
+    @property
+    def running(self):
+        return self._server is not None
+
+    @property
+    def base_url(self):
+        """URL guests on the network can reach, or None without a LAN address
+
+        Detected on every call (unless public_host is configured), so joining
+        the venue Wi-Fi after startup is picked up by the next QR code.
+        """
+        host = self.public_host or lan_ip()
+        if not host or is_loopback(host):
+            return None
+        return f'http://{host}:{self.port}'
+
+    def url_for(self, project):
+        """Local URL of a project's page, or None if guests can't reach it"""
+        path = share_path(project)
+        base_url = self.base_url
+        if not self.running or not base_url or path not in self.pages:
+            return None
+        return base_url + path
+
+    def index_url(self):
+        base_url = self.base_url
+        return base_url + '/' if self.running and base_url else None
+
+    def start(self, projects, owner, wait=False):
+        """Render pages and start serving in a daemon thread
+
+        Returns immediately unless wait is set; url_for() returns None
+        until the server is listening.
+        """
+        if self._thread is not None:
+            return
+        self._set_content(projects, owner)
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name='share-server', daemon=True)
+        self._thread.start()
+        if wait:
+            self._ready.wait(10)
+
+    def update(self, projects, owner):
+        """Re-render pages for a new project list without pausing requests
+
+        Before the server is listening this only records the new list;
+        _run renders whatever is latest once the loop is up.
+        """
+        with self._lock:
+            self._set_content(projects, owner)
+            loop = self._loop if self.running else None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._rerender(), loop)
+
+    def _set_content(self, projects, owner):
+        self._content = (projects, owner)
+        self._version += 1
+
+    def stop(self):
+        thread = self._thread
+        if thread is None:
+            return
+        # _loop is only published once the server is listening
+        self._ready.wait(10)
+        loop = self._loop
+        if loop is None:
+            self._thread = None
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        self._thread = None
+
+    async def _rerender(self):
+        with self._lock:
+            (projects, owner), version = self._content, self._version
+        if version <= self._rendered_version:
+            return
+        loop = asyncio.get_running_loop()
+        # Rendering QR SVGs is CPU work; keep the loop answering meanwhile
+        pages = await loop.run_in_executor(None, render_pages, projects, owner)
+        # Renders can overlap; never let an older one overwrite a newer one
+        if version > self._rendered_version:
+            self.pages = pages
+            self._rendered_version = version
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            with self._lock:
+                (projects, owner), version = self._content, self._version
+            self.pages = render_pages(projects, owner)
+            self._rendered_version = version
+            server = loop.run_until_complete(asyncio.start_server(
+                self._handle, self.host, self.port, backlog=BACKLOG, limit=MAX_HEADER_BYTES))
+            self.port = server.sockets[0].getsockname()[1]
+            with self._lock:
+                self._loop = loop
+                self._server = server
+                if self._version > self._rendered_version:
+                    # update() ran while we were rendering or binding
+                    loop.create_task(self._rerender())
+            where = self.base_url or f'port {self.port} (no LAN address yet, QR codes use public URLs)'
+            print(f"📡 Share server on {where} ({len(projects)} projects)")
+            self._ready.set()
+            loop.run_forever()
+        except Exception as e:
+            print(f"Share server error: {e}")
+        finally:
+            self._ready.set()
+            if self._server is not None:
+                self._server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+            self._server = None
+            self._loop = None
+
+    async def _handle(self, reader, writer):
+        """Answer requests on one keep-alive connection"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        asyncio.TimeoutError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                request = lines[0].split()
+                headers = {}
+                for line in lines[1:]:
+                    key, sep, value = line.partition(':')
+                    if sep:
+                        headers[key.strip().lower()] = value.strip()
+
+                if len(request) != 3:
+                    writer.write(self._response(400, keep_alive=False))
+                    await writer.drain()
+                    break
+
+                method, target, version = request
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                if headers.get('content-length', '0') != '0' or 'transfer-encoding' in headers:
+                    # Request bodies are never read, so the stream can't be reused
+                    keep_alive = False
+
+                writer.write(self._respond(method, target, headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Client went away, or the server is shutting down
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, method, target, headers, keep_alive):
+        self.requests += 1
+        page = self.pages.get(target.split('?', 1)[0])
+        if page is None:
+            return self._response(404, keep_alive=keep_alive)
+        if method not in ('GET', 'HEAD'):
+            return self._response(405, b'Allow: GET, HEAD\r\n', keep_alive=keep_alive)
+
+        match = headers.get('if-none-match', '')
+        if match and (match == '*' or page.etag in [tag.strip().removeprefix('W/') for tag in match.split(',')]):
+            self.not_modified += 1
+            return self._response(304, f'ETag: {page.etag}\r\n'.encode('latin-1'), keep_alive=keep_alive)
+
+        gzipped = 'gzip' in headers.get('accept-encoding', '')
+        body = page.bodies[gzipped] if method == 'GET' else b''
+        self.bytes_sent += len(body)
+        return self._response(200, page.headers[gzipped], body, keep_alive)
+
+    def _response(self, status, fields=b'', body=b'', keep_alive=True):
+        if status >= 400:
+            fields = b'Content-Length: 0\r\n' + fields
+        connection = b'Connection: keep-alive\r\n' if keep_alive else b'Connection: close\r\n'
+        return STATUS_LINES[status] + fields + connection + b'\r\n' + body
+
+# ═══════════════════════════════════════════════════════════
+# Load Test
+# ═══════════════════════════════════════════════════════════
+
+async def _load_client(host, port, paths, count, revalidate, results):
+    """One keep-alive client issuing count requests round-robin over paths"""
+    reader, writer = await asyncio.open_connection(host, port)
+    etags = {}
+    try:
+        for i in range(count):
+            path = paths[i % len(paths)]
+            request = f'GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept-Encoding: gzip\r\n'
+            if revalidate and path in etags:
+                request += f'If-None-Match: {etags[path]}\r\n'
+            started = time.perf_counter()
+            writer.write((request + '\r\n').encode('latin-1'))
+            await writer.drain()
+
+            head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+            headers = {}
+            for line in head[1:]:
+                key, sep, value = line.partition(':')
+                if sep:
+                    headers[key.strip().lower()] = value.strip()
+            await reader.readexactly(int(headers.get('content-length', 0)))
+            results.append((int(head[0].split()[1]), time.perf_counter() - started))
+            if 'etag' in headers:
+                etags[path] = headers['etag']
+    finally:
+        writer.close()
+
+async def _load_test(host, port, paths, concurrency, total, revalidate):
+    results = []
+    per_client = [total // concurrency + (1 if i < total % concurrency else 0) for i in range(concurrency)]
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(
+        _load_client(host, port, paths, count, revalidate, results)
+        for count in per_client if count
+    ), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    errors = [o for o in outcomes if isinstance(o, Exception)]
+    return results, elapsed, errors
+
+def run_load_test(server, concurrency=200, total=20000, revalidate=True):
+    """Hammer a running ShareServer on localhost and summarize latency"""
+    paths = sorted({path for path in server.pages if path != '/index.html'})
+    results, elapsed, errors = asyncio.run(
+        _load_test('127.0.0.1', server.port, paths, concurrency, total, revalidate))
+    latencies = sorted(seconds for _, seconds in results)
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    return {
+        'requests': len(results),
+        'concurrency': concurrency,
+        'seconds': elapsed,
+        'requests_per_second': len(results) / elapsed if elapsed else 0,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0,
+        'statuses': statuses,
+        'bytes_sent': server.bytes_sent,
+        'errors': [str(e) for e in errors],
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve Showcase project pages on the local network')
+    parser.add_argument('--host', default=None, help='bind address (default: config or 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=None, help=f'port (default: config or {DEFAULT_PORT})')
+    parser.add_argument('--configured', action='store_true', help='use the configured projects instead of the bundled set')
+    parser.add_argument('--load-test', action='store_true', help='benchmark the server over localhost and exit')
+    parser.add_argument('--concurrency', type=int, default=200, help='concurrent load-test connections (default: 200)')
+    parser.add_argument('--requests', type=int, default=20000, help='total load-test requests (default: 20000)')
+    parser.add_argument('--no-revalidate', action='store_true', help='never send If-None-Match in the load test')
+    parser.add_argument('--json', help='write load-test results as JSON')
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    server = ShareServer()
+    server.configure(config.get('share_server'))
+    if args.host:
+        server.host = args.host
+    if args.port is not None:
+        server.port = args.port
+    elif args.load_test:
+        server.port = 0
+    projects = load_projects(config) if args.configured else get_bundled_projects()
+
+    server.start(projects, config.get('owner', {}), wait=True)
+    if not server.running:
+        return 1
+
+    if not args.load_test:
+        print(f"🔗 Portfolio: {server.index_url() or f'http://127.0.0.1:{server.port}/ (this device only)'}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        server.stop()
+        return 0
+
+    result = run_load_test(server, max(1, args.concurrency), max(1, args.requests), not args.no_revalidate)
+    server.stop()
+    print(f"⚡ {result['requests']} requests over {result['concurrency']} connections "
+          f"in {result['seconds']:.2f}s ({result['requests_per_second']:,.0f} req/s)")
+    print(f"   p50 {result['p50_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms  "
+          f"statuses {result['statuses']}  bytes {result['bytes_sent']:,}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"📄 Results written to {args.json}")
+    if result['errors']:
+        print(f"❌ {len(result['errors'])} client errors, e.g. {result['errors'][0]}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
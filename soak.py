@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+✨ Showcase - Memory Soak Test
+Repeatedly opens and dismisses QR popups, cycles carousel slides and
+rebuilds HomeScreen while tracking RSS, live widgets, textures and gc
+objects. Exits non-zero when growth after warmup passes the thresholds.
+
+Usage:
+    python soak.py --cycles 5000
+    xvfb-run -a python soak.py --report soak.json   # machines without a display
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+
+os.environ.setdefault('KIVY_NO_ARGS', '1')
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+
+from kivy.config import Config
+# Run cycles as fast as the loop allows instead of at display refresh rate
+Config.set('graphics', 'maxfps', '0')
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.uix.widget import Widget
+from kivy.uix.screenmanager import ScreenManager
+from kivy.graphics.texture import Texture
+
+from portfolio import get_bundled_projects, load_config, load_projects
+from main import HomeScreen, QRPopup
+
+# ═══════════════════════════════════════════════════════════
+# Measurements
+# ═══════════════════════════════════════════════════════════
+
+def rss_bytes():
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+def take_sample(cycle):
+    """Collect garbage, then count what is still alive"""
+    gc.collect()
+    objects = gc.get_objects()
+    return {
+        'cycle': cycle,
+        'time': time.perf_counter(),
+        'rss_mb': rss_bytes() / (1024 * 1024),
+        'widgets': sum(1 for o in objects if isinstance(o, Widget)),
+        'textures': sum(1 for o in objects if isinstance(o, Texture)),
+        'gc_objects': len(objects),
+    }
+
+def growth(baseline, final):
+    return {key: final[key] - baseline[key] for key in ('rss_mb', 'widgets', 'textures', 'gc_objects')}
+
+# ═══════════════════════════════════════════════════════════
+# Soak App
+# ═══════════════════════════════════════════════════════════
+
+class SoakApp(App):
+    """Drives the real Showcase widgets through open/close/rebuild cycles"""
+
+    def __init__(self, args, projects, **kwargs):
+        super().__init__(**kwargs)
+        self.args = args
+        self.projects = projects
+        self.cycle = 0
+        self.samples = []
+        self.baseline = None
+        self.result = None
+        self._sample_due = False
+
+    def build(self):
+        self.sm = ScreenManager()
+        self.home = HomeScreen(projects=self.projects, config=load_config(), name='home')
+        self.sm.add_widget(self.home)
+        return self.sm
+
+    def on_start(self):
+        self.home.carousel.anim_move_duration = 0
+        Clock.schedule_interval(self._step, 0)
+
+    def _step(self, dt):
+        args = self.args
+        if self._sample_due:
+            # Sampled a frame after the cycle so pending Clock callbacks
+            # have released widgets from the last rebuild
+            self._sample_due = False
+            sample = take_sample(self.cycle)
+            self.samples.append(sample)
+            self._print_sample(sample)
+            if self.baseline is None:
+                self.baseline = sample
+            if self.cycle >= args.cycles:
+                self._finish()
+                return False
+            return
+
+        self.cycle += 1
+
+        project = self.projects[self.cycle % len(self.projects)]
+        popup = QRPopup(project)
+        popup.open(animation=False)
+        popup.dismiss(animation=False)
+
+        self.home.carousel.load_next()
+
+        if self.cycle % args.rebuild_every == 0:
+            self.home.set_projects(list(self.projects))
+            self.home.carousel.anim_move_duration = 0
+
+        if (self.cycle == args.warmup or self.cycle >= args.cycles
+                or (self.cycle > args.warmup and self.cycle % args.sample_every == 0)):
+            self._sample_due = True
+
+    def _print_sample(self, sample):
+        print(f"cycle {sample['cycle']:>6}  rss {sample['rss_mb']:7.1f} MB  "
+              f"widgets {sample['widgets']:>6}  textures {sample['textures']:>5}  "
+              f"gc {sample['gc_objects']:>8}")
+
+    def _finish(self):
+        args = self.args
+        delta = growth(self.baseline, self.samples[-1])
+        limits = {
+            'rss_mb': args.max_rss_mb,
+            'widgets': args.max_widgets,
+            'textures': args.max_textures,
+            'gc_objects': args.max_gc_objects,
+        }
+        failures = [key for key, limit in limits.items() if delta[key] > limit]
+        self.result = {
+            'cycles': self.cycle,
+            'growth': delta,
+            'limits': limits,
+            'failures': failures,
+            'samples': self.samples,
+        }
+
+        print("")
+        for key, limit in limits.items():
+            mark = '❌' if key in failures else '✅'
+            print(f"{mark} {key} growth {delta[key]:+.1f} (limit {limit})")
+        if args.report:
+            with open(args.report, 'w') as f:
+                json.dump(self.result, f, indent=2)
+            print(f"📄 Report written to {args.report}")
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Memory soak test for the Showcase UI')
+    parser.add_argument('--cycles', type=int, default=2000, help='popup/slide cycles to run (default: 2000)')
+    parser.add_argument('--warmup', type=int, default=200, help='cycles before the baseline sample (default: 200)')
+    parser.add_argument('--sample-every', type=int, default=250, help='cycles between samples (default: 250)')
+    parser.add_argument('--rebuild-every', type=int, default=50, help='cycles between HomeScreen rebuilds (default: 50)')
+    parser.add_argument('--configured', action='store_true', help='use the configured projects instead of the bundled set')
+    parser.add_argument('--max-rss-mb', type=float, default=20, help='allowed RSS growth in MB (default: 20)')
+    parser.add_argument('--max-widgets', type=int, default=50, help='allowed live widget growth (default: 50)')
+    parser.add_argument('--max-textures', type=int, default=20, help='allowed live texture growth (default: 20)')
+    parser.add_argument('--max-gc-objects', type=int, default=5000, help='allowed gc object growth (default: 5000)')
+    parser.add_argument('--report', help='write samples and verdict as JSON')
+    args = parser.parse_args(argv)
+    args.warmup = min(args.warmup, args.cycles)
+
+    projects = load_projects() if args.configured else get_bundled_projects()
+    app = SoakApp(args, projects)
+    app.run()
+
+    if app.result is None:
+        print("❌ Soak run did not complete")
+        return 2
+    return 1 if app.result['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+✨ Showcase - Local GitHub Stub Server
+Stand-in for the pinned-repos service and the GitHub REST repo listing,
+with injectable latency, timeouts, 5xx / 403 rate-limit responses and
+large payloads. Point config.json at it with:
+
+    "github": {
+        "pinned_api_url": "http://127.0.0.1:8765/pinned",
+        "api_url": "http://127.0.0.1:8765"
+    }
+
+Usage:
+    python stub_github.py --port 8765 --latency 0.3 --fault 5xx --fault-count 2
+    python stub_github.py --fixtures fixtures/github    # serve recorded JSON
+    python stub_github.py --tls                         # https, self-signed cert
+"""
+
+import re
+import sys
+import ssl
+import json
+import gzip
+import time
+import argparse
+import threading
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+FAULTS = ('none', 'timeout', '5xx', 'rate_limit')
+
+REPOS_PATH = re.compile(r'^/(users|orgs)/([^/]+)/repos/?$')
+
+# Self-signed certificate for --tls; no client trusts it, so verification
+# always fails and exercises the CERT_NONE fallback
+TLS_DIR = Path(__file__).resolve().parent / 'fixtures' / 'tls'
+TLS_CERT = TLS_DIR / 'stub-cert.pem'
+TLS_KEY = TLS_DIR / 'stub-key.pem'
+
+# ═══════════════════════════════════════════════════════════
+# Synthetic Data
+# ═══════════════════════════════════════════════════════════
+
+LANGUAGES = ['Python', 'TypeScript', 'Go', 'Rust', None]
+
+def make_repos(owner, count=30, description_size=80, fork_every=4):
+    """Deterministic REST-style repo objects (every fork_every-th is a fork)"""
+    repos = []
+    for i in range(count):
+        name = f'{owner}-repo-{i:03d}'
+        repos.append({
+            'id': i + 1,
+            'name': name,
+            'full_name': f'{owner}/{name}',
+            'fork': bool(fork_every) and i % fork_every == fork_every - 1,
+            'description': (f'Project {i} by {owner}. ' * description_size)[:description_size],
+            'html_url': f'https://github.com/{owner}/{name}',
+            'language': LANGUAGES[i % len(LANGUAGES)],
+            'stargazers_count': (i * 37) % 500,
+            'forks_count': (i * 11) % 60,
+            'updated_at': f'2025-{12 - i % 12:02d}-{1 + i % 28:02d}T12:00:00Z',
+            'owner': {'login': owner},
+        })
+    return repos
+
+def make_pinned(owner, count=6):
+    """Pinned-service-style objects for the first count repos"""
+    return [{
+        'owner': owner,
+        'repo': repo['name'],
+        'description': repo['description'],
+        'link': repo['html_url'],
+        'language': repo['language'] or '',
+        'stars': repo['stargazers_count'],
+        'forks': repo['forks_count'],
+    } for repo in make_repos(owner, count)]
+
+# ═══════════════════════════════════════════════════════════
+# Server
+# ═══════════════════════════════════════════════════════════
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        server = self.server
+        request_number = server.record_request()
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.fault != 'none' and (server.fault_count == 0 or request_number <= server.fault_count):
+            if server.fault == 'timeout':
+                # Hold the connection past any sensible client timeout
+                time.sleep(server.hang_seconds)
+                return self._send_json(504, {'message': 'Gateway Timeout'})
+            if server.fault == '5xx':
+                return self._send_json(503, {'message': 'Service Unavailable'})
+            if server.fault == 'rate_limit':
+                return self._send_json(403, {'message': 'API rate limit exceeded'}, {
+                    'X-RateLimit-Limit': '60',
+                    'X-RateLimit-Remaining': '0',
+                    'X-RateLimit-Reset': str(int(time.time()) + 3600),
+                })
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path.rstrip('/') == '/pinned':
+            owner = query.get('username', [''])[0]
+            if server.fixtures_dir:
+                pinned = server.fixture('pinned', owner) or []
+            else:
+                pinned = [] if server.empty_pinned else make_pinned(owner, server.pinned_count)
+            return self._send_json(200, pinned)
+
+        match = REPOS_PATH.match(url.path)
+        if match:
+            owner = match.group(2)
+            if server.fixtures_dir:
+                repos = server.fixture('repos', owner)
+                if repos is None:
+                    return self._send_json(404, {'message': 'Not Found'})
+            else:
+                repos = make_repos(owner, server.repo_count, server.description_size)
+            if query.get('sort', [''])[0] == 'updated':
+                # Newest first, like the real listing (which RepoRanker relies on)
+                repos = sorted(repos, key=lambda r: r.get('updated_at') or '', reverse=True)
+            per_page = int(query.get('per_page', ['30'])[0])
+            page = int(query.get('page', ['1'])[0])
+            return self._send_json(200, repos[(page - 1) * per_page:page * per_page])
+
+        return self._send_json(404, {'message': 'Not Found'})
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        encoding = None
+        if self.server.gzip and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            encoding = 'gzip'
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped reading early (e.g. after enough repos)
+            return
+        self.server.record_bytes(len(body))
+
+
+class StubGitHubServer(ThreadingHTTPServer):
+    """Threaded stub server; use as a context manager to run in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, fault='none', fault_count=0,
+                 hang_seconds=30.0, repo_count=30, description_size=80, pinned_count=6,
+                 empty_pinned=False, gzip=True, fixtures_dir=None, tls=False, verbose=False):
+        super().__init__((host, port), StubHandler)
+        self.tls = tls
+        if tls:
+            ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ctx.load_cert_chain(TLS_CERT, TLS_KEY)
+            # Handshake in the handler thread, not in serve_forever's accept()
+            self.socket = ctx.wrap_socket(self.socket, server_side=True, do_handshake_on_connect=False)
+        self.latency = latency
+        self.fault = fault
+        self.fault_count = fault_count
+        self.hang_seconds = hang_seconds
+        self.repo_count = repo_count
+        self.description_size = description_size
+        self.pinned_count = pinned_count
+        self.empty_pinned = empty_pinned
+        self.gzip = gzip
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else None
+        self.verbose = verbose
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        scheme = 'https' if self.tls else 'http'
+        return f'{scheme}://{host}:{port}'
+
+    def github_config(self):
+        """config.json github endpoint overrides pointing at this server"""
+        return {'pinned_api_url': f'{self.base_url}/pinned', 'api_url': self.base_url}
+
+    def handle_error(self, request, client_address):
+        # Clients rejecting the self-signed certificate are expected in TLS mode
+        if self.verbose or not isinstance(sys.exc_info()[1], (ssl.SSLError, ConnectionError)):
+            super().handle_error(request, client_address)
+
+    def fixture(self, kind, owner):
+        """Recorded response from <fixtures_dir>/<kind>-<owner>.json, if any"""
+        path = self.fixtures_dir / f'{kind}-{owner.lower()}.json'
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+            return self.requests
+
+    def record_bytes(self, count):
+        with self._lock:
+            self.bytes_sent += count
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Local GitHub stub server for Showcase')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--fault', choices=FAULTS, default='none', help='fault to inject')
+    parser.add_argument('--fault-count', type=int, default=0, help='fail only the first N requests (0 = all)')
+    parser.add_argument('--repos', type=int, default=30, help='repos per account')
+    parser.add_argument('--description-size', type=int, default=80, help='characters per repo description')
+    parser.add_argument('--empty-pinned', action='store_true', help='return no pinned repos (forces REST fallback)')
+    parser.add_argument('--no-gzip', action='store_true', help='never compress responses')
+    parser.add_argument('--fixtures', help='serve pinned-<owner>.json / repos-<owner>.json from this directory')
+    parser.add_argument('--tls', action='store_true', help='serve https with a self-signed certificate')
+    args = parser.parse_args(argv)
+
+    server = StubGitHubServer(
+        args.host, args.port, latency=args.latency, fault=args.fault, fault_count=args.fault_count,
+        repo_count=args.repos, description_size=args.description_size,
+        empty_pinned=args.empty_pinned, gzip=not args.no_gzip, fixtures_dir=args.fixtures, tls=args.tls,
+        verbose=True)
+    print(f"🧪 Stub GitHub listening on {server.base_url}")
+    print(f"   pinned_api_url: {server.base_url}/pinned")
+    print(f"   api_url:        {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
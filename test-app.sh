@@ -81,11 +81,8 @@ python << 'EOF'
 import sys
 sys.path.insert(0, '.')
 
-# Import without running Kivy app
-import os
-os.environ['KIVY_NO_ARGS'] = '1'
-
-from main import load_projects, load_config
+# The data layer imports without Kivy
+from portfolio import load_projects, load_config
 
 projects = load_projects()
 config = load_config()
@@ -0,0 +1,148 @@
+"""Multi-account resolution: normalizing, caching, deadlines and merging"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from portfolio import (
+    ProjectsUnavailable, account_cache_file, fetch_github_accounts, github_accounts,
+    load_cached_github, load_projects, merge_projects, ranking_settings, save_github_cache,
+)
+from stub_github import StubGitHubServer
+
+
+def project(name, url=None, **extra):
+    return {'id': name, 'name': name, 'url': url or f'https://github.com/owner/{name}', **extra}
+
+
+def age_cache(account, cache_dir, minutes):
+    """Backdate an account's cache file by the given number of minutes"""
+    cache_file = account_cache_file(account, cache_dir)
+    cache = json.loads(cache_file.read_text())
+    cache['timestamp'] = (datetime.now() - timedelta(minutes=minutes)).isoformat()
+    cache_file.write_text(json.dumps(cache))
+
+
+@pytest.fixture
+def hung_github():
+    """A stub whose every request hangs well past the fetch deadline"""
+    with StubGitHubServer(fault='timeout', hang_seconds=3) as server:
+        yield server
+
+
+# ── github_accounts ──────────────────────────────────────────
+
+def test_duplicate_accounts_keep_the_first_entry():
+    accounts = github_accounts({'accounts': [
+        'alice',
+        {'name': 'Alice', 'cache_ttl_minutes': 5},
+        {'name': 'alice', 'type': 'org'},
+        '  ',
+    ]})
+    assert [(a['name'], a['type'], a['cache_ttl_minutes']) for a in accounts] == [
+        ('alice', 'user', 30),
+        ('alice', 'org', 30),
+    ]
+
+
+def test_username_and_per_account_overrides():
+    assert [a['name'] for a in github_accounts({'username': 'bob'})] == ['bob']
+    accounts = github_accounts({
+        'cache_ttl_minutes': 10,
+        'ranking': {'sort': 'stars', 'limit': 4},
+        'accounts': ['a', {'name': 'b', 'cache_ttl_minutes': 0, 'ranking': {'limit': 2}}],
+    })
+    assert [a['cache_ttl_minutes'] for a in accounts] == [10, 0]
+    assert accounts[0]['ranking'] == ranking_settings({'sort': 'stars', 'limit': 4})
+    assert accounts[1]['ranking'] == ranking_settings({'sort': 'stars', 'limit': 2})
+
+
+# ── merge_projects ───────────────────────────────────────────
+
+def test_merge_dedupes_by_url():
+    alice, acme = github_accounts({'accounts': ['alice', 'acme']})
+    merged = merge_projects([
+        (alice, [project('tool', 'https://github.com/acme/tool'), project('site')]),
+        (acme, [project('tool-copy', 'HTTPS://github.com/acme/tool/'), project('lib')]),
+    ])
+    assert [p['name'] for p in merged] == ['tool', 'site', 'lib']
+    assert [p['order'] for p in merged] == [0, 1, 2]
+
+
+def test_merge_renames_colliding_ids():
+    alice, acme = github_accounts({'accounts': ['alice', 'acme']})
+    first = project('tool', 'https://github.com/alice/tool')
+    merged = merge_projects([
+        (alice, [first]),
+        (acme, [project('tool', 'https://github.com/acme/tool')]),
+    ])
+    assert [p['id'] for p in merged] == ['tool', 'acme/tool']
+    # Inputs are copied, not mutated
+    assert 'order' not in first
+
+
+# ── cache ────────────────────────────────────────────────────
+
+def test_cache_ttl_is_per_account(tmp_path):
+    short, long = github_accounts({'accounts': [
+        {'name': 'short', 'cache_ttl_minutes': 5},
+        {'name': 'long', 'cache_ttl_minutes': 60},
+    ]})
+    for account in (short, long):
+        save_github_cache(account, [project(account['name'])], tmp_path)
+        age_cache(account, tmp_path, 10)
+
+    assert load_cached_github(short, tmp_path) is None
+    assert load_cached_github(long, tmp_path) == [project('long')]
+    assert load_cached_github(short, tmp_path, allow_stale=True) == [project('short')]
+
+
+def test_ranking_change_invalidates_fresh_cache(tmp_path):
+    account, = github_accounts({'accounts': ['alice'], 'ranking': {'sort': 'stars'}})
+    save_github_cache(account, [project('a')], tmp_path)
+    assert load_cached_github(account, tmp_path) == [project('a')]
+
+    reranked, = github_accounts({'accounts': ['alice'], 'ranking': {'sort': 'forks'}})
+    assert load_cached_github(reranked, tmp_path) is None
+    assert load_cached_github(reranked, tmp_path, allow_stale=True) == [project('a')]
+
+
+# ── fetch_github_accounts ────────────────────────────────────
+
+def test_stale_cache_is_used_after_the_deadline(tmp_path, hung_github):
+    stale, fresh, uncached = github_accounts({'accounts': ['stale', 'fresh', 'uncached'],
+                                              'cache_ttl_minutes': 30})
+    save_github_cache(stale, [project('old')], tmp_path)
+    age_cache(stale, tmp_path, 120)
+    save_github_cache(fresh, [project('new')], tmp_path)
+
+    started = time.monotonic()
+    results = fetch_github_accounts([stale, fresh, uncached], tmp_path, deadline=0.5,
+                                    endpoints=hung_github.github_config())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2
+    assert [(account['name'], projects) for account, projects in results] == [
+        ('stale', [project('old')]),
+        ('fresh', [project('new')]),
+    ]
+    # The fresh account was served from cache without a request
+    assert hung_github.requests == 2
+
+
+def test_strict_load_raises_for_a_missing_account(tmp_path, hung_github):
+    config = {'github': {
+        'use_pinned': True,
+        'accounts': ['cached', 'missing'],
+        'fetch_deadline_seconds': 0.5,
+        **hung_github.github_config(),
+    }}
+    cached, _ = github_accounts(config['github'])
+    save_github_cache(cached, [project('a')], tmp_path)
+
+    with pytest.raises(ProjectsUnavailable, match='missing'):
+        load_projects(config, cache_dir=tmp_path, strict=True)
+    # Without strict the missing account is dropped
+    assert [p['name'] for p in load_projects(config, cache_dir=tmp_path)] == ['a']
@@ -0,0 +1,30 @@
+"""export.py: every job gets its own output folder"""
+
+import json
+
+import export
+
+
+def write_config(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({'owner': {'name': path.parent.name}}))
+    return path
+
+
+def test_config_stems_collide_across_client_dirs(tmp_path):
+    paths = [write_config(tmp_path / 'clients' / name / 'config.json') for name in ('acme', 'beta')]
+    jobs = export.assign_unique_slugs([export.config_job(p) for p in paths])
+    assert [j['slug'] for j in jobs] == ['acme-config', 'beta-config']
+
+
+def test_username_and_repeated_config_get_suffixes(tmp_path):
+    path = write_config(tmp_path / 'alice.json')
+    jobs = [export.config_job(path), export.config_job(path), export.username_job('Alice', {})]
+    slugs = [j['slug'] for j in export.assign_unique_slugs(jobs)]
+    assert len({s.lower() for s in slugs}) == 3
+    assert slugs[2] == 'Alice'
+
+
+def test_unique_slugs_are_left_alone(tmp_path):
+    jobs = [export.config_job(write_config(tmp_path / 'a.json')), export.username_job('bob', {})]
+    assert [j['slug'] for j in export.assign_unique_slugs(jobs)] == ['a', 'bob']
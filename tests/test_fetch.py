@@ -0,0 +1,18 @@
+"""fetch_url_with_retry against the stub server"""
+
+from portfolio import fetch_url_with_retry, fetch_github_pinned_repos
+from stub_github import StubGitHubServer
+
+
+def test_untrusted_certificate_falls_back_to_unverified_tls(capsys):
+    with StubGitHubServer(tls=True, pinned_count=3) as server:
+        assert server.base_url.startswith('https://')
+        pinned = fetch_url_with_retry(f'{server.base_url}/pinned?username=alice', timeout=5)
+    assert len(pinned) == 3
+    assert 'CERTIFICATE_VERIFY_FAILED' in capsys.readouterr().out
+
+
+def test_pinned_repos_over_tls():
+    with StubGitHubServer(tls=True) as server:
+        projects = fetch_github_pinned_repos('alice', timeout=5, **server.github_config())
+    assert [p['name'] for p in projects] == [f'alice-repo-{i:03d}' for i in range(6)]
@@ -0,0 +1,91 @@
+"""iter_json_array: incremental decoding of streamed JSON arrays"""
+
+import io
+import json
+
+import pytest
+
+from portfolio import iter_json_array
+
+
+class CountingStream(io.BytesIO):
+    """BytesIO that records how many read() calls were made"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+def decode(data, chunk_size):
+    return list(iter_json_array(io.BytesIO(data), chunk_size=chunk_size))
+
+
+PAYLOAD = [
+    0, -1, 12345, -1.5e10, 3.25, 1e-7, True, False, None,
+    'plain', 'quote " and \\ backslash', 'café', '中文', '\U0001f600 emoji',
+    {'name': 'repo', 'stars': 42, 'tags': ['a', 'b'], 'nested': {'x': [1, 2.5, None]}},
+    [], {}, [[1], [2, [3]]],
+]
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 65))
+def test_round_trips_at_every_chunk_size(chunk_size):
+    data = json.dumps(PAYLOAD, ensure_ascii=False).encode('utf-8')
+    assert decode(data, chunk_size) == PAYLOAD
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 20))
+def test_numbers_split_at_chunk_boundaries(chunk_size):
+    # A prefix such as "-1.5" or "123" decodes on its own; it must not be accepted early
+    data = b'[123456789, -1.5e10, 2.0E-3 ,7]'
+    assert decode(data, chunk_size) == [123456789, -1.5e10, 2.0e-3, 7]
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 9))
+def test_multibyte_utf8_split_across_chunks(chunk_size):
+    values = ['éé', '中', '\U0001f600\U0001f680', 'aéb']
+    data = json.dumps(values, ensure_ascii=False).encode('utf-8')
+    assert decode(data, chunk_size) == values
+
+
+@pytest.mark.parametrize('data', [b'[]', b'  [ ]  ', b'\n[\n]\n'])
+def test_empty_arrays(data):
+    assert decode(data, 2) == []
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'{"a": 1}',
+    b'"text"',
+    b'[1 2]',
+    b'[1,',
+    b'[1,]',
+    b'[1; 2]',
+    b'[{"a": 1]',
+    b'["unterminated',
+])
+def test_malformed_input_raises(data):
+    with pytest.raises(ValueError):
+        decode(data, 3)
+
+
+def test_elements_before_an_error_are_still_yielded():
+    items = iter_json_array(io.BytesIO(b'[1, 2, oops]'), chunk_size=4)
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(ValueError):
+        next(items)
+
+
+def test_early_close_stops_reading():
+    data = json.dumps([{'i': i, 'pad': 'x' * 50} for i in range(1000)]).encode('utf-8')
+    stream = CountingStream(data)
+    items = iter_json_array(stream, chunk_size=64)
+    assert next(items)['i'] == 0
+    items.close()
+    assert stream.reads < 5
+    assert stream.tell() < len(data) // 100
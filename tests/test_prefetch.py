@@ -0,0 +1,58 @@
+"""prefetch.py: the build-time bundle, run offline against recorded fixtures"""
+
+import json
+from pathlib import Path
+
+import prefetch
+from portfolio import project_url, projects_digest
+from qrcodes import bundled_qr_path
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'fixtures' / 'github'
+
+
+def write_config(tmp_path, github):
+    config = {'owner': {'name': 'Fixture Owner'}, 'github': {'use_pinned': True, **github}}
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(config))
+    return path, config
+
+
+def test_bundle_from_fixtures(tmp_path):
+    config_path, config = write_config(tmp_path, {'username': 'wizelements'})
+    out = tmp_path / 'bundle'
+
+    assert prefetch.main(['--config', str(config_path), '--fixtures', str(FIXTURES), '--out', str(out)]) == 0
+
+    bundle = json.loads((out / 'projects.json').read_text())
+    pinned = json.loads((FIXTURES / 'pinned-wizelements.json').read_text())
+    assert [p['name'] for p in bundle['projects']] == [p['repo'] for p in pinned]
+    assert bundle['owner'] == config['owner']
+    assert bundle['digest'] == projects_digest(bundle['projects'], config['owner'])
+    for project in bundle['projects']:
+        for size in prefetch.QR_SIZES:
+            path = bundled_qr_path(project_url(project), size, out / 'qr')
+            assert path is not None and path.read_bytes().startswith(b'\x89PNG')
+    assert len(list((out / 'qr').iterdir())) == len(bundle['projects']) * len(prefetch.QR_SIZES)
+
+
+def test_org_bundle_is_ranked_from_the_rest_listing(tmp_path):
+    config_path, _ = write_config(tmp_path, {
+        'accounts': [{'name': 'wizelements', 'type': 'org'}],
+        'ranking': {'sort': 'stars', 'limit': 2},
+    })
+    out = tmp_path / 'bundle'
+
+    assert prefetch.main(['--config', str(config_path), '--fixtures', str(FIXTURES), '--out', str(out)]) == 0
+
+    bundle = json.loads((out / 'projects.json').read_text())
+    assert [p['name'] for p in bundle['projects']] == ['showcase-native', 'cod3black-site']
+
+
+def test_unknown_account_writes_no_bundle(tmp_path):
+    config_path, _ = write_config(tmp_path, {'accounts': [{'name': 'nobody', 'type': 'org'}]})
+    out = tmp_path / 'bundle'
+    out.mkdir()
+    (out / 'projects.json').write_text('{"projects": []}')
+
+    assert prefetch.main(['--config', str(config_path), '--fixtures', str(FIXTURES), '--out', str(out)]) == 1
+    assert (out / 'projects.json').read_text() == '{"projects": []}'
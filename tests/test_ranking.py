@@ -0,0 +1,112 @@
+"""RepoRanker: bounded top-k ranking of streamed REST repos"""
+
+import io
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from portfolio import RANKING_SORTS, RepoRanker, ranking_settings
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+LANGUAGES = ['Python', 'Go', 'Rust', 'TypeScript', None]
+
+
+def make_repo(rng, i):
+    updated = datetime.fromtimestamp(NOW, timezone.utc) - timedelta(days=rng.randint(0, 40))
+    return {
+        'name': f'repo-{i}',
+        'full_name': f'owner/repo-{i}',
+        'fork': rng.random() < 0.25,
+        'language': rng.choice(LANGUAGES),
+        # Narrow ranges so ties (and the -seen tie-break) are common
+        'stargazers_count': rng.randint(0, 8),
+        'forks_count': rng.randint(0, 4),
+        'updated_at': updated.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'html_url': f'https://github.com/owner/repo-{i}',
+    }
+
+
+def reference(repos, ranking):
+    """Brute force: filter, sort everything, take the first limit"""
+    ranker = RepoRanker(ranking, now=NOW)
+    candidates = [(ranker.rank_key(r), -i, r['name']) for i, r in enumerate(repos) if ranker.accepts(r)]
+    candidates.sort(reverse=True)
+    return [name for _, _, name in candidates[:ranking['limit']]]
+
+
+def rank(repos, ranking, page_size=7):
+    ranker = RepoRanker(ranking, now=NOW)
+    for start in range(0, len(repos), page_size):
+        page = json.dumps(repos[start:start + page_size]).encode('utf-8')
+        ranker.consume(io.BytesIO(page))
+        if ranker.done:
+            break
+    return ranker
+
+
+@pytest.mark.parametrize('sort', [s for s in RANKING_SORTS if s != 'updated'])
+def test_heap_matches_sorted_reference(sort):
+    rng = random.Random(sort)
+    for _ in range(200):
+        repos = [make_repo(rng, i) for i in range(rng.randint(0, 60))]
+        ranking = ranking_settings({
+            'sort': sort,
+            'limit': rng.randint(1, 10),
+            'include_forks': rng.random() < 0.5,
+            'languages': rng.choice([[], ['python'], ['Go', 'RUST']]),
+        })
+        projects = rank(repos, ranking).projects()
+        assert [p['name'] for p in projects] == reference(repos, ranking)
+        assert [p['order'] for p in projects] == list(range(len(projects)))
+
+
+def test_updated_stops_once_limit_is_reached_on_a_newest_first_listing():
+    rng = random.Random(7)
+    repos = sorted((make_repo(rng, i) for i in range(50)), key=lambda r: r['updated_at'], reverse=True)
+    ranking = ranking_settings({'sort': 'updated', 'limit': 5, 'include_forks': True})
+    ranker = rank(repos, ranking, page_size=100)
+    assert ranker.done
+    assert ranker.seen == 5
+    assert [p['name'] for p in ranker.projects()] == [r['name'] for r in repos[:5]]
+
+
+def test_ties_keep_the_repo_listed_first():
+    repos = [{'name': f'repo-{i}', 'stargazers_count': 3, 'updated_at': '2025-01-01T00:00:00Z'}
+             for i in range(10)]
+    ranker = rank(repos, ranking_settings({'sort': 'stars', 'limit': 4}))
+    assert [p['name'] for p in ranker.projects()] == ['repo-0', 'repo-1', 'repo-2', 'repo-3']
+
+
+def test_language_filter_and_forks():
+    repos = [
+        {'name': 'a', 'language': 'Python', 'stargazers_count': 1},
+        {'name': 'b', 'language': 'Go', 'stargazers_count': 9},
+        {'name': 'c', 'language': 'python', 'stargazers_count': 5, 'fork': True},
+        {'name': 'd', 'language': None, 'stargazers_count': 7},
+    ]
+    ranking = ranking_settings({'sort': 'stars', 'languages': ['PYTHON']})
+    assert [p['name'] for p in rank(repos, ranking).projects()] == ['a']
+    ranking = ranking_settings({'sort': 'stars', 'languages': 'python', 'include_forks': True})
+    assert [p['name'] for p in rank(repos, ranking).projects()] == ['c', 'a']
+
+
+def test_repeated_repos_are_ranked_once():
+    repo = {'name': 'dup', 'full_name': 'o/dup', 'stargazers_count': 5}
+    ranker = RepoRanker(ranking_settings({'sort': 'stars'}), now=NOW)
+    for item in (repo, dict(repo), {'name': 'other', 'stargazers_count': 1}, 'not a repo'):
+        ranker.push(item)
+    assert [p['name'] for p in ranker.projects()] == ['dup', 'other']
+
+
+def test_ranking_settings_merges_overrides():
+    ranking = ranking_settings(
+        {'sort': 'score', 'weights': {'stars': 3}, 'languages': ['Go', 'go']},
+        {'limit': '2', 'weights': {'forks': 0}},
+    )
+    assert ranking['sort'] == 'score'
+    assert ranking['limit'] == 2
+    assert ranking['languages'] == ['go']
+    assert ranking['weights'] == {'stars': 3, 'forks': 0, 'recency': 2.0}
+    assert ranking_settings({'sort': 'bogus'})['sort'] == 'updated'
@@ -0,0 +1,66 @@
+"""share_server.py: updates are never lost, whenever they arrive"""
+
+import json
+import threading
+import time
+import urllib.request
+
+import share_server
+from share_server import ShareServer
+
+
+def fetch_names(server):
+    url = f'http://127.0.0.1:{server.port}/portfolio.json'
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        return [p['name'] for p in json.load(resp)['projects']]
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def started_server():
+    server = ShareServer()
+    server.configure({'enabled': True, 'host': '127.0.0.1', 'port': 0})
+    return server
+
+
+def test_update_before_listening_is_rendered(monkeypatch):
+    rendering, release = threading.Event(), threading.Event()
+    render_pages = share_server.render_pages
+
+    def slow_first_render(projects, owner):
+        if not rendering.is_set():
+            rendering.set()
+            release.wait(5)
+        return render_pages(projects, owner)
+
+    monkeypatch.setattr(share_server, 'render_pages', slow_first_render)
+    server = started_server()
+    server.start([{'id': 'old', 'name': 'old'}], {})
+    try:
+        assert rendering.wait(5)
+        server.update([{'id': 'new', 'name': 'new'}], {})
+        release.set()
+        assert server._ready.wait(5) and server.running
+        assert wait_for(lambda: fetch_names(server) == ['new'])
+    finally:
+        server.stop()
+
+
+def test_update_while_running_replaces_pages():
+    server = started_server()
+    server.start([{'id': 'a', 'name': 'a'}], {}, wait=True)
+    try:
+        assert fetch_names(server) == ['a']
+        server.update([{'id': 'b', 'name': 'b'}], {})
+        server.update([{'id': 'c', 'name': 'c'}], {})
+        assert wait_for(lambda: fetch_names(server) == ['c'])
+    finally:
+        server.stop()
+    assert not server.running
@@ -0,0 +1,40 @@
+"""
+✨ Showcase - Theme
+Shared color palette for the Kivy app and static exports
+"""
+
+# ═══════════════════════════════════════════════════════════
+# Colors
+# ═══════════════════════════════════════════════════════════
+
+COLORS = {
+    'bg_primary': '#0d0d12',
+    'bg_secondary': '#16161e',
+    'bg_card': '#1a1a24',
+    'bg_card_hover': '#222230',
+    'accent': '#7c3aed',
+    'accent_light': '#a78bfa',
+    'accent_glow': '#8b5cf6',
+    'gradient_start': '#6366f1',
+    'gradient_end': '#8b5cf6',
+    'text_primary': '#f8fafc',
+    'text_secondary': '#cbd5e1',
+    'text_muted': '#64748b',
+    'success': '#22c55e',
+    'success_glow': '#4ade80',
+    'warning': '#f59e0b',
+    'border': '#2d2d3a',
+    'border_glow': '#7c3aed',
+    'gold': '#fbbf24',
+    'silver': '#94a3b8',
+}
+
+GLOW_COLORS = [COLORS['accent_glow'], COLORS['success'], COLORS['gold'], COLORS['accent_light']]
+
+def hex_to_rgba(hex_color, alpha=1):
+    """Convert hex color to RGBA tuple"""
+    hex_color = hex_color.lstrip('#')
+    r = int(hex_color[0:2], 16) / 255
+    g = int(hex_color[2:4], 16) / 255
+    b = int(hex_color[4:6], 16) / 255
+    return (r, g, b, alpha)
@@ -0,0 +1,136 @@
+"""
+✨ Showcase - Tracing
+Lightweight nested spans exported as Chrome trace-event JSON
+(open in chrome://tracing or https://ui.perfetto.dev)
+
+Enable with SHOWCASE_TRACE=/path/trace.json, `"debug": {"trace_file": ...}`
+in config.json, or tracing.enable(path). When disabled, span() returns a
+shared no-op object, so instrumented code pays one global check.
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+from functools import wraps
+
+_enabled = False
+_path = None
+_events = []
+_threads = set()
+_lock = threading.Lock()
+_pid = os.getpid()
+_origin = time.perf_counter_ns()
+
+def _now_us():
+    return (time.perf_counter_ns() - _origin) / 1000
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    """A timed region recorded as a complete ("X") trace event"""
+
+    __slots__ = ('name', 'attrs', 'start')
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.start = 0
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _now_us()
+        if exc_type is not None:
+            self.attrs['error'] = f'{exc_type.__name__}: {exc}'
+        _record(self.name, self.start, end - self.start, self.attrs)
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes discovered while the span is open"""
+        self.attrs.update(attrs)
+
+
+def _record(name, start, duration, attrs):
+    thread = threading.current_thread()
+    with _lock:
+        if thread.ident not in _threads:
+            _threads.add(thread.ident)
+            _events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': _pid, 'tid': thread.ident,
+                'args': {'name': thread.name},
+            })
+        _events.append({
+            'name': name, 'cat': 'showcase', 'ph': 'X', 'pid': _pid, 'tid': thread.ident,
+            'ts': start, 'dur': duration, 'args': attrs,
+        })
+
+# ═══════════════════════════════════════════════════════════
+# Public API
+# ═══════════════════════════════════════════════════════════
+
+def enabled():
+    return _enabled
+
+def enable(path):
+    """Start recording spans and write them to path at exit"""
+    global _enabled, _path
+    if not _enabled:
+        atexit.register(write)
+    _path = str(path)
+    _enabled = True
+
+def span(name, /, **attrs):
+    """Context manager timing a region; no-op unless tracing is enabled"""
+    if not _enabled:
+        return _NOOP
+    return Span(name, attrs)
+
+def traced(name=None):
+    """Decorator wrapping every call of a function in a span"""
+    def decorator(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def write(path=None):
+    """Write recorded events as Chrome trace-event JSON"""
+    path = path or _path
+    if not path:
+        return None
+    with _lock:
+        events = list(_events)
+    try:
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+    except Exception as e:
+        print(f"Trace write error: {e}")
+        return None
+
+
+if os.environ.get('SHOWCASE_TRACE'):
+    enable(os.environ['SHOWCASE_TRACE'])